@@ -20,6 +20,7 @@ Compatibility:
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 # Safe import helpers and allowlist
@@ -31,13 +32,19 @@ from .base import ServiceAdapter
 __all__ = ["LocalPythonAdapter"]
 
 # Allowlist of modules and their permitted callable entrypoints.
-# Populated minimally based on current configs/examples.
-ALLOWED_LOCAL_MODULES: dict[str, set[str]] = {
-    "api.services.translator": {"router_translate"},
-    "api.services.search": {"router_search"},
-    # Optional mock for local testing (only if referenced by configs)
-    "api.services.mock_chat": {"mock_chat_completion"},
-}
+# Populated minimally based on current configs/examples. Read-only, so the
+# key->module view below can never fall out of step with it.
+ALLOWED_LOCAL_MODULES: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        "api.services.translator": frozenset({"router_translate"}),
+        "api.services.search": frozenset({"router_search"}),
+        # Optional mock for local testing (only if referenced by configs)
+        "api.services.mock_chat": frozenset({"mock_chat_completion"}),
+    }
+)
+
+# Explicit key->module mapping for safe_import, built once from the allowlist.
+_ALLOWED_MODULE_MAP: Mapping[str, str] = MappingProxyType({m: m for m in ALLOWED_LOCAL_MODULES})
 
 
 def _resolve_function(path: str) -> Callable[[dict[str, Any]], object]:
@@ -74,9 +81,8 @@ def _resolve_function(path: str) -> Callable[[dict[str, Any]], object]:
         )
 
     # Import module via safe helper (explicit key->module mapping)
-    allowed_map = {m: m for m in ALLOWED_LOCAL_MODULES}
     try:
-        module = safe_import(module_name, allowed_map)
+        module = safe_import(module_name, _ALLOWED_MODULE_MAP)
     except Exception as exc:
         # Keep prior semantics while clarifying if import fails
         raise AdapterError(
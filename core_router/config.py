@@ -6,11 +6,14 @@ Config loader for core_router services.
 - Normalize field synonyms (kind <-> adapter).
 - Map rate_limit_per_minute to rate_limits when needed.
 - Apply DINO_SERVICE_{KEY}__ env overrides.
+- Optionally cache parsed YAML as JSON under $DINOAIR_CONFIG_CACHE_DIR.
 - Construct ServiceDescriptor via pydantic and wrap errors.
 """
 
 from __future__ import annotations
 
+import glob
+import hashlib
 import json
 import os
 import re
@@ -31,6 +34,9 @@ if TYPE_CHECKING:
 # Type alias for common mapping type
 StrAnyMapping = Mapping[str, Any]
 
+# Env var naming a directory for JSON copies of parsed YAML; unset disables the cache
+_DOCUMENT_CACHE_ENV = "DINOAIR_CONFIG_CACHE_DIR"
+
 __all__ = ["load_services_from_file"]
 
 
@@ -231,7 +237,8 @@ def _parse_document(text: str, *, prefer: str | None = None) -> Any:
     def try_yaml() -> Any:
         if yaml is None:
             raise RuntimeError("PyYAML required. Install 'pyyaml'.")
-        return yaml.safe_load(text)
+        # The libyaml-backed loader is much faster when PyYAML was built with it
+        return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     def try_json() -> Any:
         return json.loads(text)
@@ -276,6 +283,65 @@ def _parse_services_payload(text: str, *, prefer: str | None) -> Any:
     return _parse_document(text, prefer=prefer)
 
 
+def _document_cache_prefix(p: Path) -> str | None:
+    """
+    Cache file prefix for ``p`` inside the configured cache directory, or None
+    when caching is disabled. The prefix includes a digest of the resolved
+    source path, so same-named files in different directories do not collide.
+    """
+    cache_dir = os.environ.get(_DOCUMENT_CACHE_ENV, "").strip()
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(str(p.resolve()).encode("utf-8")).hexdigest()[:16]
+    return str(Path(cache_dir).expanduser() / f"{p.name}.{digest}")
+
+
+def _document_cache_path(prefix: str, st: os.stat_result) -> Path:
+    """JSON cache file for a source, keyed by the source's mtime and size."""
+    return Path(f"{prefix}.{st.st_mtime_ns}-{st.st_size}.json")
+
+
+def _write_document_cache(prefix: str, cache_path: Path, doc: Any) -> None:
+    """
+    Best-effort write of a parsed document to its JSON cache file, removing
+    files left by older versions of the source.
+    """
+    with suppress(OSError, TypeError, ValueError):
+        payload = json.dumps(doc)
+        # JSON would silently turn non-string keys and other YAML-only values
+        # into something else; only cache documents that round-trip exactly
+        if json.loads(payload) != doc:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"{glob.escape(Path(prefix).name)}.*.json"):
+            with suppress(OSError):
+                stale.unlink()
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+
+def _load_services_document(p: Path) -> Any:
+    """
+    Parse the services file at ``p``. When DINOAIR_CONFIG_CACHE_DIR is set,
+    YAML documents are cached there as JSON, so later loads of an unchanged
+    file skip the YAML parser. Nothing is written anywhere otherwise.
+    """
+    prefer = _preferred_format_from_ext(p.suffix.lower())
+    prefix = _document_cache_prefix(p) if prefer != "json" else None
+    cache_path: Path | None = None
+    if prefix is not None:
+        with suppress(OSError, ValueError):
+            cache_path = _document_cache_path(prefix, p.stat())
+            return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    text, _ext = _read_config_text(p)
+    doc = _parse_services_payload(text, prefer=prefer)
+    if prefix is not None and cache_path is not None:
+        _write_document_cache(prefix, cache_path, doc)
+    return doc
+
+
 def _extract_services_block(doc: Any) -> list[Any]:
     if isinstance(doc, list):
         return cast("list[Any]", doc)
@@ -336,9 +402,7 @@ def load_services_from_file(
     from .registry import ServiceDescriptor as SD
 
     p = _resolve_config_path(path)
-    text, ext = _read_config_text(p)
-    prefer = _preferred_format_from_ext(ext)
-    doc = _parse_services_payload(text, prefer=prefer)
+    doc = _load_services_document(p)
     services_raw = _extract_services_block(doc)
 
     env = dict(os.environ) if apply_env else {}
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import UTC
+import os
+import time
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Protocol
 
@@ -32,12 +34,30 @@ class HealthState(str, Enum):
 
 
 def _now_iso8601() -> str:
-    from datetime import datetime
-
     return datetime.now(UTC).isoformat()
 
 
+# Liveness probes can hit /health every second; the registration probe result
+# is reused for this many seconds
+_ADAPTER_STATUS_TTL_SECONDS = 1.0
+_adapter_status_cache: tuple[float, str] | None = None
+
+
 def _adapter_registration_status() -> str:
+    """
+    Cached wrapper around _probe_adapter_registration (see _ADAPTER_STATUS_TTL_SECONDS).
+    """
+    global _adapter_status_cache
+    now = time.monotonic()
+    cached = _adapter_status_cache
+    if cached is not None and now - cached[0] < _ADAPTER_STATUS_TTL_SECONDS:
+        return cached[1]
+    status = _probe_adapter_registration()
+    _adapter_status_cache = (now, status)
+    return status
+
+
+def _probe_adapter_registration() -> str:
     """
     Best-effort check for adapter registration presence via ServiceRegistry.
     Returns 'ok' if a registry is available (presence), else 'unknown'.
@@ -130,8 +150,6 @@ def version_info() -> dict[str, object]:
         except Exception:
             version = "0.0.0"
 
-    import os
-
     build = os.getenv("DINO_BUILD") or None
     commit = os.getenv("DINO_COMMIT") or None
     return {"version": str(version), "build": build, "commit": commit}
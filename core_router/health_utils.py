@@ -7,7 +7,7 @@ depend on other core_router modules to avoid circular imports.
 
 from __future__ import annotations
 
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Protocol
 
 
@@ -39,12 +39,13 @@ def ping_with_timing(adapter: SupportsPing) -> tuple[str, int]:
     Returns state as string to avoid importing HealthState enum and
     creating circular dependencies.
     """
-    start = perf_counter()
+    start = perf_counter_ns()
     try:
         ok = bool(adapter.ping())
-        duration_ms = int(round((perf_counter() - start) * 1000))
+        # Integer nanoseconds rounded to the nearest millisecond
+        duration_ms = (perf_counter_ns() - start + 500_000) // 1_000_000
         state = "HEALTHY" if ok else "DEGRADED"
         return (state, duration_ms)
     except Exception:
-        duration_ms = int(round((perf_counter() - start) * 1000))
+        duration_ms = (perf_counter_ns() - start + 500_000) // 1_000_000
         return ("DOWN", duration_ms)
@@ -8,12 +8,15 @@ Provides:
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from contextlib import suppress
+import concurrent.futures
+import os
+import time
+from collections.abc import Callable, Iterable, Mapping
+from functools import cache
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic.config import ConfigDict
 
 from .errors import ServiceNotFound
@@ -22,6 +25,8 @@ from .health import HealthState
 if TYPE_CHECKING:
     import builtins
 
+    import httpx
+
 
 class ServiceDescriptor(BaseModel):
     """Pydantic model for a service's static config and runtime hints."""
@@ -46,8 +51,18 @@ class ServiceDescriptor(BaseModel):
     health: dict[str, Any] | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
-    # Pydantic v2 configuration
-    model_config = ConfigDict(validate_assignment=True, frozen=False)
+    # Pydantic v2 configuration. Assignments are not revalidated: the registry
+    # writes health through _set_health with an already-normalized dict.
+    # Unknown fields are rejected rather than silently dropped.
+    model_config = ConfigDict(validate_assignment=False, frozen=False, extra="forbid")
+
+    # Lower-cased tags, filled in by ServiceRegistry when the service is registered
+    _tags_lower: frozenset[str] = PrivateAttr(default=frozenset())
+
+    def _set_health(self, info: dict[str, Any]) -> None:
+        """Store a normalized health snapshot without a pydantic round-trip."""
+        object.__setattr__(self, "health", info)
+        self.__pydantic_fields_set__.add("health")
 
 
 class ServiceRegistry:
@@ -56,11 +71,48 @@ class ServiceRegistry:
 
     - Services are keyed by unique 'name'.
     - Registering an existing name overwrites the previous descriptor.
+    - Writers copy the name map and publish the new dict under the lock;
+      readers take the current dict without locking and always see a
+      consistent snapshot.
+    - Tags are indexed case-insensitively when a service is registered;
+      re-register a descriptor after changing its tags.
     """
 
     def __init__(self) -> None:
         self._lock: Lock = Lock()
         self._services: dict[str, ServiceDescriptor] = {}
+        self._tag_index: dict[str, tuple[ServiceDescriptor, ...]] = {}
+        self._snapshot: tuple[ServiceDescriptor, ...] = ()
+
+    def _publish(self, services: dict[str, ServiceDescriptor]) -> None:
+        """Install a new name map and its tag index. Caller holds the lock."""
+        index: dict[str, builtins.list[ServiceDescriptor]] = {}
+        for sd in services.values():
+            for tag in sd._tags_lower:
+                index.setdefault(tag, []).append(sd)
+        self._tag_index = {tag: tuple(descs) for tag, descs in index.items()}
+        self._snapshot = tuple(services.values())
+        self._services = services
+
+    def _store(self, *descs: ServiceDescriptor) -> None:
+        """Publish a copy of the name map that includes ``descs``."""
+        # Lower-case once per registration rather than on every index rebuild
+        for sd in descs:
+            sd._tags_lower = frozenset(t.lower() for t in sd.tags)
+        with self._lock:
+            services = dict(self._services)
+            for sd in descs:
+                services[sd.name] = sd
+            self._publish(services)
+
+    @staticmethod
+    def _coerce(desc: ServiceDescriptor | Mapping[str, Any], *, trusted: bool) -> ServiceDescriptor:
+        """Return ``desc`` as a ServiceDescriptor, validating mappings unless trusted."""
+        if isinstance(desc, ServiceDescriptor):
+            return desc
+        if trusted:
+            return ServiceDescriptor.model_construct(**dict(desc))
+        return ServiceDescriptor.model_validate(desc)
 
     # -------------------------
     # CRUD / Lookup
@@ -71,15 +123,50 @@ class ServiceRegistry:
 
         Accepts a ServiceDescriptor or plain dict. Returns stored descriptor.
         """
-        sd = desc if isinstance(desc, ServiceDescriptor) else ServiceDescriptor(**dict(desc))
-        with self._lock:
-            self._services[sd.name] = sd
-            return sd
+        sd = self._coerce(desc, trusted=False)
+        self._store(sd)
+        return sd
+
+    def register_trusted(self, data: ServiceDescriptor | Mapping[str, Any]) -> ServiceDescriptor:
+        """
+        Register or replace by name without pydantic validation.
+
+        Only for input that was already validated, such as descriptors
+        loaded by load_services_from_file. Mappings are turned into
+        descriptors with ``model_construct``, which skips validators and type
+        coercion; use register() for anything supplied from outside.
+        """
+        sd = self._coerce(data, trusted=True)
+        self._store(sd)
+        return sd
+
+    def register_many(
+        self,
+        descs: Iterable[ServiceDescriptor | Mapping[str, Any]],
+        *,
+        trusted: bool = False,
+    ) -> builtins.list[ServiceDescriptor]:
+        """
+        Register or replace several services with one lock acquisition and
+        one index rebuild.
+
+        Mappings are validated like register(), or constructed without
+        validation like register_trusted() when ``trusted`` is set. Nothing
+        is registered if any entry fails. Returns the stored descriptors.
+        """
+        sds = [self._coerce(d, trusted=trusted) for d in descs]
+        self._store(*sds)
+        return sds
 
     def unregister(self, name: str) -> bool:
         """Remove a service by name. True if removed, else False."""
         with self._lock:
-            return self._services.pop(name, None) is not None
+            if name not in self._services:
+                return False
+            services = dict(self._services)
+            del services[name]
+            self._publish(services)
+            return True
 
     def get_by_name(self, name: str) -> ServiceDescriptor:
         """
@@ -88,22 +175,27 @@ class ServiceRegistry:
         Raises:
             ServiceNotFound: if the service does not exist.
         """
-        with self._lock:
-            try:
-                return self._services[name]
-            except KeyError as exc:
-                raise ServiceNotFound(f"Service '{name}' not found") from exc
+        sd = self._services.get(name)
+        if sd is None:
+            raise ServiceNotFound(f"Service '{name}' not found")
+        return sd
 
     def get_by_tag(self, tag: str) -> builtins.list[ServiceDescriptor]:
         """Return services containing the tag (case-insensitive)."""
-        t = (tag or "").lower()
-        with self._lock:
-            return [d for d in self._services.values() if t in {x.lower() for x in d.tags}]
+        return list(self._tag_index.get((tag or "").lower(), ()))
 
     def list(self) -> builtins.list[ServiceDescriptor]:
         """Return all registered services."""
-        with self._lock:
-            return list(self._services.values())
+        return list(self._snapshot)
+
+    def snapshot(self) -> tuple[ServiceDescriptor, ...]:
+        """
+        Return all registered services as an immutable tuple.
+
+        The tuple is built once per registry write and shared between
+        callers, so polling it costs no allocation.
+        """
+        return self._snapshot
 
     # -------------------------
     # Health
@@ -124,40 +216,99 @@ class ServiceRegistry:
 
         Returns the updated ServiceDescriptor.
         """
+        info: dict[str, Any]
+        if isinstance(state_or_info, Mapping):
+            info = _normalize_health_dict(state_or_info)
+        else:
+            # Build dict from discrete values
+            info = {"state": _STATE_VALUES[state_or_info]}
+            if latency_ms is not None:
+                info["latency_ms"] = float(latency_ms)
+        if error is not None:
+            info["error"] = str(error)
+
         with self._lock:
             try:
                 desc = self._services[name]
             except KeyError as exc:
                 raise ServiceNotFound(f"Service '{name}' not found") from exc
-
-            info: dict[str, Any]
-            if isinstance(state_or_info, Mapping):
-                # Normalize provided dict
-                info = dict(state_or_info)
-                s = info.get("state")
-                if isinstance(s, HealthState):
-                    info["state"] = s.value
-                elif isinstance(s, str):
-                    info["state"] = s.upper()
-                # best-effort numeric coercion
-                if "latency_ms" in info:
-                    with suppress(Exception):
-                        info["latency_ms"] = float(info["latency_ms"])
-            else:
-                # Build dict from discrete values
-                info = {"state": state_or_info.value}
-                if latency_ms is not None:
-                    info["latency_ms"] = float(latency_ms)
-            if error is not None:
-                info["error"] = str(error)
-            desc.health = info
+            desc._set_health(info)
             return desc
 
 
+# Lookup tables for health-state normalization: enum member -> value, and the
+# usual spellings of each state -> its upper-case form
+_STATE_VALUES: dict[HealthState, str] = {s: s.value for s in HealthState}
+_UPPER_STATE_STRINGS: dict[str, str] = {v: s.value.upper() for s in HealthState for v in (s.value, s.value.upper())}
+
+
+def _normalize_health_dict(info: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a health snapshot: enum or lower-case states become upper-case
+    strings and latency_ms becomes a float when it is numeric.
+
+    Always returns a new dict, so the caller's mapping is never stored.
+    """
+    out = dict(info)
+    state = out.get("state")
+    if isinstance(state, HealthState):
+        out["state"] = _STATE_VALUES[state]
+    elif isinstance(state, str) and not state.isupper():
+        upper = _UPPER_STATE_STRINGS.get(state)
+        out["state"] = upper if upper is not None else state.upper()
+    # best-effort numeric coercion
+    if "latency_ms" in out and type(out["latency_ms"]) is not float:
+        try:
+            out["latency_ms"] = float(out["latency_ms"])
+        except (TypeError, ValueError):
+            pass
+    return out
+
+
 # -------------------------
 # Auto-registration helper (soft validation)
 # -------------------------
 
+# httpx and the config loader are imported on first use and kept here, so
+# importing the registry stays cheap and later calls skip the import machinery
+_httpx: Any = None
+_load_services_from_file: Callable[[str], list[ServiceDescriptor]] | None = None
+
+
+def _get_httpx() -> Any:
+    """Return the httpx module, importing it on first use."""
+    global _httpx
+    if _httpx is None:
+        import httpx as _httpx_module
+
+        _httpx = _httpx_module
+    return _httpx
+
+
+def _get_services_loader() -> Callable[[str], list[ServiceDescriptor]]:
+    """Return config.load_services_from_file, importing it on first use."""
+    global _load_services_from_file
+    if _load_services_from_file is None:
+        from .config import load_services_from_file
+
+        _load_services_from_file = load_services_from_file
+    return _load_services_from_file
+
+
+# Per-request timeout and concurrency of LM Studio reachability probes
+# (a refused or unroutable host fails after the short connect timeout instead
+# of the whole request budget)
+_PROBE_CONNECT_TIMEOUT_SECONDS = 0.2
+_PROBE_READ_TIMEOUT_SECONDS = 0.6
+_MAX_PROBE_WORKERS = 8
+_MAX_PROBE_KEEPALIVE = 16
+
+# Probe results are reused per base_url for DINO_PROBE_TTL seconds, so repeated
+# auto-registration (tests, multi-worker servers) skips the network
+_DEFAULT_PROBE_TTL_SECONDS = 30.0
+_PROBE_CACHE: dict[str, tuple[float, bool]] = {}
+_PROBE_CACHE_LOCK = Lock()
+
 
 def auto_register_from_config_and_env(
     registry: ServiceRegistry,
@@ -170,12 +321,16 @@ def auto_register_from_config_and_env(
 
     Returns the provided registry for chaining.
     """
-    from .health import HealthState as _HealthState
-
     services = _load_services_safely(services_file)
 
-    for s in services:
-        _register_service_safely(registry, s, _HealthState)
+    registered = _register_services_safely(registry, services)
+    lmstudio_services = [s for s in registered if _is_lmstudio_service(s)]
+    if not lmstudio_services:
+        # Common local-only config: nothing to probe
+        return registry
+
+    # Minimal reachability check for LM Studio services
+    _probe_lmstudio_services(registry, lmstudio_services, HealthState)
 
     return registry
 
@@ -189,50 +344,71 @@ def _load_services_safely(services_file: str) -> list:
     Returns:
         List of service descriptors (empty list on error)
     """
-    from .config import load_services_from_file
-
     try:
-        return load_services_from_file(services_file)
+        return _get_services_loader()(services_file)
     except Exception:
         return []
 
 
-def _register_service_safely(registry: ServiceRegistry, service: Any, health_state_cls: Any) -> None:
-    """Register a service and validate its health if it's an LM Studio service.
+def _register_services_safely(registry: ServiceRegistry, services: list) -> list:
+    """Register services in one batch, falling back to one at a time on failure.
 
     Args:
         registry: Service registry
-        service: Service descriptor to register
-        health_state_cls: HealthState class
+        services: Service descriptors to register
+
+    Returns:
+        The services that were registered
     """
+    # Entries come from load_services_from_file, which already validated them
     try:
-        registry.register(service)
+        return registry.register_many(services, trusted=True)
     except Exception:
-        return
+        return [s for s in services if _register_service_safely(registry, s)]
 
-    # Minimal reachability check for LM Studio services
-    if not _is_lmstudio_service(service):
-        return
 
-    _validate_and_probe_service(registry, service, health_state_cls)
+def _register_service_safely(registry: ServiceRegistry, service: Any) -> bool:
+    """Register a service, returning False instead of raising on failure.
 
+    Args:
+        registry: Service registry
+        service: Service descriptor to register
+
+    Returns:
+        True if the service was registered
+    """
+    try:
+        registry.register_trusted(service)
+    except Exception:
+        return False
+    return True
 
-def _validate_and_probe_service(registry: ServiceRegistry, service: Any, health_state_cls: Any) -> None:
-    """Validate service configuration and probe its health.
+
+def _probe_lmstudio_services(registry: ServiceRegistry, services: list, health_state_cls: Any) -> None:
+    """Probe LM Studio services concurrently and record their health.
 
     Args:
         registry: Service registry
-        service: Service descriptor
+        services: Registered LM Studio service descriptors
         health_state_cls: HealthState class
     """
-    base_url = _extract_base_url(service)
-    if not base_url:
-        _mark_service_degraded(registry, service.name, "missing base_url")
+    targets: list[tuple[str, str]] = []
+    for service in services:
+        base_url = _extract_base_url(service)
+        if base_url:
+            targets.append((service.name, base_url))
+        else:
+            _mark_service_degraded(registry, service.name, "missing base_url")
+
+    if not targets:
         return
 
-    # Probe service health
-    is_healthy = _probe_service_health(base_url)
-    _update_service_health(registry, service.name, is_healthy, health_state_cls)
+    # Probes share one connection pool and run side by side, so startup waits
+    # for the slowest probe instead of the sum of all of them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(targets))) as executor:
+        results = executor.map(_probe_service_health_cached, [url for _, url in targets])
+        for (name, _), is_healthy in zip(targets, results, strict=True):
+            _update_service_health(registry, name, is_healthy, health_state_cls)
 
 
 def _is_lmstudio_service(service: Any) -> bool:
@@ -257,11 +433,13 @@ def _extract_base_url(service: Any) -> str | None:
     Returns:
         Base URL string or None if not found
     """
-    with suppress(Exception):
-        cfg = getattr(service, "adapter_config", {}) or {}
-        base_url = str(cfg.get("base_url") or "").strip() or None
-        return base_url
-    return None
+    cfg = getattr(service, "adapter_config", {}) or {}
+    try:
+        base_url = cfg.get("base_url")
+    except AttributeError:
+        # adapter_config is not a mapping
+        return None
+    return str(base_url or "").strip() or None
 
 
 def _mark_service_degraded(registry: ServiceRegistry, service_name: str, error_msg: str) -> None:
@@ -272,14 +450,22 @@ def _mark_service_degraded(registry: ServiceRegistry, service_name: str, error_m
         service_name: Name of the service
         error_msg: Error message to record
     """
-    from .health import HealthState as _HealthState
+    try:
+        registry.update_health(service_name, HealthState.degraded, latency_ms=0, error=error_msg)
+    except ServiceNotFound:
+        pass
 
-    with suppress(Exception):
-        registry.update_health(service_name, _HealthState.DEGRADED, latency_ms=0, error=error_msg)
 
+def _probe_ttl_seconds() -> float:
+    """Return the probe cache TTL from DINO_PROBE_TTL (seconds, default 30)."""
+    try:
+        return float(os.getenv("DINO_PROBE_TTL", _DEFAULT_PROBE_TTL_SECONDS))
+    except ValueError:
+        return _DEFAULT_PROBE_TTL_SECONDS
 
-def _probe_service_health(base_url: str) -> bool:
-    """Probe service health using HTTP HEAD/GET requests.
+
+def _probe_service_health_cached(base_url: str) -> bool:
+    """_probe_service_health, reusing a result younger than the probe TTL.
 
     Args:
         base_url: Base URL to probe
@@ -287,19 +473,53 @@ def _probe_service_health(base_url: str) -> bool:
     Returns:
         True if service responds successfully
     """
-    import httpx
+    now = time.monotonic()
+    with _PROBE_CACHE_LOCK:
+        cached = _PROBE_CACHE.get(base_url)
+    if cached is not None and now < cached[0]:
+        return cached[1]
 
-    # Try HEAD first
-    with suppress(Exception):
-        r = httpx.head(base_url, timeout=0.8)
-        if 200 <= r.status_code < 300:
-            return True
+    is_healthy = _probe_service_health(base_url)
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE[base_url] = (now + _probe_ttl_seconds(), is_healthy)
+    return is_healthy
+
+
+@cache
+def _probe_client() -> httpx.Client:
+    """Shared HTTP client for health probes, so probes reuse connections."""
+    httpx = _get_httpx()
+    return httpx.Client(
+        timeout=httpx.Timeout(
+            connect=_PROBE_CONNECT_TIMEOUT_SECONDS,
+            read=_PROBE_READ_TIMEOUT_SECONDS,
+            write=_PROBE_CONNECT_TIMEOUT_SECONDS,
+            pool=_PROBE_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(max_keepalive_connections=_MAX_PROBE_KEEPALIVE),
+    )
 
-    # Fallback to GET
-    with suppress(Exception):
-        r2 = httpx.get(base_url, timeout=0.8)
-        if 200 <= r2.status_code < 300:
-            return True
+
+def _probe_service_health(base_url: str) -> bool:
+    """Probe service health using HTTP HEAD/GET requests.
+
+    Args:
+        base_url: Base URL to probe
+
+    Returns:
+        True if service responds successfully
+    """
+    httpx = _get_httpx()
+    client = _probe_client()
+
+    # Try HEAD first, then fall back to GET
+    for method in (client.head, client.get):
+        try:
+            if 200 <= method(base_url).status_code < 300:
+                return True
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+            # ValueError covers hosts httpx cannot IDNA-encode
+            continue
 
     return False
 
@@ -318,9 +538,11 @@ def _update_service_health(
         is_healthy: Whether service is healthy
         health_state_cls: HealthState class
     """
-    with suppress(Exception):
+    try:
         registry.update_health(
             service_name,
-            health_state_cls.HEALTHY if is_healthy else health_state_cls.DEGRADED,
+            health_state_cls.healthy if is_healthy else health_state_cls.degraded,
             latency_ms=0,
         )
+    except ServiceNotFound:
+        pass
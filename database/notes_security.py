@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from utils.logger import Logger
@@ -19,12 +20,19 @@ from utils.safe_imports import safe_import, safe_load_attr
 
 # Allowlisted security policy providers:
 # Maps a logical key to (module_path, {allowed_attributes})
-# Default allows only this module's get_notes_security factory.
+# Default allows only this module's get_notes_security factory. Read-only, so
+# the key->module view below can never fall out of step with it.
 DEFAULT_POLICY_KEY = "default"
 DEFAULT_POLICY_ATTRIBUTE = "get_notes_security"
-ALLOWED_SECURITY_POLICIES: dict[str, tuple[str, set[str]]] = {
-    DEFAULT_POLICY_KEY: ("database.notes_security", {DEFAULT_POLICY_ATTRIBUTE}),
-}
+ALLOWED_SECURITY_POLICIES: Mapping[str, tuple[str, frozenset[str]]] = MappingProxyType(
+    {
+        DEFAULT_POLICY_KEY: ("database.notes_security", frozenset({DEFAULT_POLICY_ATTRIBUTE})),
+    }
+)
+# Logical key -> module path view of the allowlist, built once for safe_import.
+_ALLOWED_POLICY_MODULES: Mapping[str, str] = MappingProxyType(
+    {k: mod for k, (mod, _attrs) in ALLOWED_SECURITY_POLICIES.items()}
+)
 
 SecurityPolicyFactory = Callable[[], "SecurityPolicy"]
 _SECURITY_POLICY_FACTORY: SecurityPolicyFactory | None = None
@@ -75,7 +83,7 @@ def _validate_policy_instance(candidate: Any) -> SecurityPolicy:
     return candidate
 
 
-def _load_policy_by_logical_key(key: str, allowed_map: dict[str, str]) -> SecurityPolicy:
+def _load_policy_by_logical_key(key: str, allowed_map: Mapping[str, str]) -> SecurityPolicy:
     """Load a security policy using a logical key from ALLOWED_SECURITY_POLICIES."""
     module = safe_import(key, allowed_map)
     _mod_path, allowed_attrs = ALLOWED_SECURITY_POLICIES[key]
@@ -87,7 +95,7 @@ def _load_policy_by_logical_key(key: str, allowed_map: dict[str, str]) -> Securi
 
 def _find_allowed_module_key(
     module_name: str,
-) -> tuple[str | None, set[str] | None]:
+) -> tuple[str | None, frozenset[str] | None]:
     """Find the key and allowed attributes for a module in ALLOWED_SECURITY_POLICIES."""
     for k, (mod, attrs) in ALLOWED_SECURITY_POLICIES.items():
         if mod == module_name:
@@ -98,7 +106,7 @@ def _find_allowed_module_key(
 def _load_policy_by_module_spec(
     module_name: str,
     attribute: str,
-    allowed_map: dict[str, str],
+    allowed_map: Mapping[str, str],
     logger: Logger,
 ) -> SecurityPolicy | None:
     """Load a security policy using module[:attribute] specification."""
@@ -112,7 +120,7 @@ def _load_policy_by_module_spec(
 
     module = safe_import(key_for_module, allowed_map)
     attr_name = (attribute or DEFAULT_POLICY_ATTRIBUTE).strip()
-    attr = safe_load_attr(module, attr_name, allowed_attrs or set())
+    attr = safe_load_attr(module, attr_name, allowed_attrs or frozenset())
     candidate = _instantiate_policy_candidate(attr)
     return _validate_policy_instance(candidate)
 
@@ -123,7 +131,7 @@ def _load_policy_from_env() -> SecurityPolicy | None:
     if not module_spec:
         return None
 
-    allowed_map = {k: mod for k, (mod, _attrs) in ALLOWED_SECURITY_POLICIES.items()}
+    allowed_map = _ALLOWED_POLICY_MODULES
     logger = Logger()
 
     # Case 1: policy specified by logical key
@@ -65,6 +65,31 @@ class WatchdogCommandHandler:
             "history_size",
         }
 
+    def _match(self, command: str) -> tuple[Callable[..., CommandResult], tuple[str, ...]] | None:
+        """Find the handler and regex arguments for a command.
+
+        Args:
+            command: Command string to match
+
+        Returns:
+            Tuple of (handler, args) for the first matching pattern, or None
+        """
+        command_lower = command.lower().strip()
+        for pattern, handler in self.command_patterns.items():
+            match = re.match(pattern, command_lower)
+            if match:
+                return handler, match.groups()
+        return None
+
+    def _dispatch(self, handler: Callable[..., CommandResult], args: tuple[str, ...]) -> CommandResult:
+        """Execute a matched handler, guarding against a missing watchdog."""
+        if not self.watchdog:
+            return CommandResult(
+                success=False,
+                message="❌ Watchdog not initialized. Cannot process commands.",
+            )
+        return handler(*args)
+
     def can_handle(self, command: str) -> bool:
         """Check if this handler can process the command.
 
@@ -74,8 +99,22 @@ class WatchdogCommandHandler:
         Returns:
             True if this handler can process the command
         """
-        command_lower = command.lower().strip()
-        return any(re.match(pattern, command_lower) for pattern in self.command_patterns)
+        return self._match(command) is not None
+
+    def try_handle(self, command: str) -> CommandResult | None:
+        """Handle a watchdog command if it matches, parsing it only once.
+
+        Args:
+            command: Command string to process
+
+        Returns:
+            CommandResult with execution results, or None if the command
+            is not a watchdog command
+        """
+        matched = self._match(command)
+        if matched is None:
+            return None
+        return self._dispatch(*matched)
 
     def handle_command(self, command: str) -> CommandResult:
         """Handle a watchdog command.
@@ -86,22 +125,14 @@ class WatchdogCommandHandler:
         Returns:
             CommandResult with execution results
         """
+        result = self.try_handle(command)
+        if result is not None:
+            return result
         if not self.watchdog:
             return CommandResult(
                 success=False,
                 message="❌ Watchdog not initialized. Cannot process commands.",
             )
-
-        command_lower = command.lower().strip()
-
-        # Find matching pattern and execute handler
-        for pattern, handler in self.command_patterns.items():
-            match = re.match(pattern, command_lower)
-            if match:
-                # Extract arguments from regex groups
-                args = match.groups() if match.groups() else ()
-                return handler(*args)
-
         return CommandResult(success=False, message=f"❌ Unknown watchdog command: {command}")
 
     def handle_status(self) -> CommandResult:
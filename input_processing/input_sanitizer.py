@@ -5,6 +5,7 @@ and classifies user input to ensure clean and safe interaction with the
 LLM model.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any, Protocol
 
@@ -32,6 +33,9 @@ from .stages import (  # Enhanced security; Validation; Intent classification; P
 MAX_WATCHDOG_ALERTS_HISTORY = 100
 HIGH_CONFIDENCE_THRESHOLD = 0.8
 
+# Indexed by ``confidence > HIGH_CONFIDENCE_THRESHOLD``
+_CONFIDENCE_EMOJI = ("🤔", "🎯")
+
 
 class FeedbackChannel(Protocol):
     """Protocol for UI-agnostic feedback callbacks."""
@@ -49,6 +53,8 @@ def _noop_feedback(_: str) -> None:
 class ContextManager:
     """Manage conversation context history."""
 
+    __slots__ = ("history", "limit")
+
     def __init__(self, history_limit: int = 5) -> None:
         """Initialize context manager with history limit."""
         self.history: list[str] = []  # list of past prompts or intents
@@ -79,6 +85,31 @@ class InputPipeline:
         skip_empty_feedback: Whether to skip feedback for empty inputs.
     """
 
+    # Pipelines may be created per session/connection; avoid a per-instance __dict__.
+    __slots__ = (
+        "feedback_channel",
+        "skip_empty_feedback",
+        "enable_enhanced_security",
+        "watchdog_ref",
+        "main_window_ref",
+        "_validator",
+        "escaper",
+        "pattern_normalizer",
+        "profanity_filter",
+        "intent_classifier",
+        "enhanced_sanitizer",
+        "rate_limiter",
+        "user_id",
+        "context",
+        "watchdog_handler",
+        "watchdog_alerts_history",
+        "security_counters",
+    )
+
+    # Source of the stateless XSS/SQL/Unicode protection stages shared by all
+    # pipelines; each pipeline still gets its own attack monitor.
+    _shared_protections: EnhancedInputSanitizer | None = None
+
     def __init__(
         self,
         feedback_channel: FeedbackChannel | None = None,
@@ -116,16 +147,31 @@ class InputPipeline:
 
     def _setup_components(self, model_type: str) -> None:
         """Setup core processing components."""
-        self.validator = InputValidator()
+        # The regex validator is only used when enhanced security is off;
+        # otherwise it is built on first access via the ``validator`` property.
+        self._validator: InputValidator | None = None if self.enable_enhanced_security else InputValidator()
         self.escaper = TextEscaper(model_type)
         self.pattern_normalizer = PatternNormalizer()
         self.profanity_filter = ProfanityFilter()
         self.intent_classifier = IntentClassifier()
 
+    @property
+    def validator(self) -> InputValidator:
+        """Return the regex input validator, creating it on first use."""
+        if self._validator is None:
+            self._validator = InputValidator()
+        return self._validator
+
     def _setup_security(self, _watchdog_ref: Any | None) -> None:
         """Setup enhanced security components."""
         # Enhanced sanitizer doesn't require external logger - it has internal logging
-        self.enhanced_sanitizer = EnhancedInputSanitizer(None) if self.enable_enhanced_security else None
+        if not self.enable_enhanced_security:
+            self.enhanced_sanitizer = None
+            return
+        cls = type(self)
+        if cls._shared_protections is None:
+            cls._shared_protections = EnhancedInputSanitizer(None)
+        self.enhanced_sanitizer = EnhancedInputSanitizer(None, protections_from=cls._shared_protections)
 
     def _setup_rate_limiter(self) -> None:
         """Setup rate limiting configuration."""
@@ -180,14 +226,13 @@ class InputPipeline:
         if not self.enhanced_sanitizer:
             return text
 
+        # The sanitizer (and its attack monitor) is shared, so count only this call's attacks.
         try:
-            sanitized = self.enhanced_sanitizer.sanitize_input(
-                text, context="general", allow_unicode=True, strict_mode=False
+            (sanitized,), attacks = self.enhanced_sanitizer.sanitize_batch(
+                [text], context="general", allow_unicode=True, strict_mode=False
             )
-            summary = self.enhanced_sanitizer.get_security_summary()
-            attacks = summary.get("total_attacks", 0)
             if attacks > 0:
-                self._increment_counter("attacks_blocked", int(attacks))
+                self._increment_counter("attacks_blocked", attacks)
                 self.feedback_channel(f"🛡️ Security: Blocked {attacks} attack(s)")
             return sanitized
         except ValueError as e:
@@ -195,12 +240,43 @@ class InputPipeline:
             self.feedback_channel(f"🚨 Security: {str(e)}")
             raise InputPipelineError(str(e)) from e
 
+    def _process_enhanced_security_batch(self, texts: list[str]) -> list[str]:
+        """Sanitize a batch of inputs, reporting blocked attacks once for the batch.
+
+        Args:
+            texts: The input texts to sanitize.
+
+        Returns:
+            The sanitized texts, in input order.
+
+        Raises:
+            InputPipelineError: If sanitization fails due to a strict mode violation.
+        """
+        if not self.enhanced_sanitizer:
+            return list(texts)
+
+        try:
+            sanitized, attacks = self.enhanced_sanitizer.sanitize_batch(
+                texts, context="general", allow_unicode=True, strict_mode=False
+            )
+        except ValueError as e:
+            self._increment_counter("rejections", 1)
+            self.feedback_channel(f"🚨 Security: {str(e)}")
+            raise InputPipelineError(str(e)) from e
+
+        if attacks > 0:
+            self._increment_counter("attacks_blocked", attacks)
+            self.feedback_channel(f"🛡️ Security: Blocked {attacks} attack(s)")
+        return sanitized
+
     def _check_rate_limit(self) -> None:
         """Check if the current request is within rate limits.
 
         Raises:
             InputPipelineError: If rate limit is exceeded.
         """
+        if self.rate_limiter.try_acquire(self.user_id, action="default"):
+            return
         status = self.rate_limiter.check_rate_limit(self.user_id, action="default")
         if not status.allowed:
             self.feedback_channel(f"⏱️ {status.message}")
@@ -243,6 +319,60 @@ class InputPipeline:
             return self._process_enhanced_security(raw)
         return self._validate_input(raw)
 
+    def _normalize_stage(self, text: str, metadata: dict[str, Any]) -> str:
+        """Report pattern normalization and apply LLM-specific escaping."""
+        if metadata.get("changed"):
+            self.feedback_channel("✨ Input normalized")
+        return self.escaper.escape(text)
+
+    def _filter_profanity_stage(self, text: str) -> str:
+        """Filter profanity from text and surface feedback when content changes."""
+        filter_result = self.profanity_filter.filter(text)
+        if not filter_result.has_profanity:
+            return text
+        severity_emoji = {
+            Severity.MILD: "😅",
+            Severity.MODERATE: "⚠️",
+            Severity.SEVERE: "🚨",
+            Severity.HATE: "🛑",
+        }
+        if filter_result.max_severity:
+            emoji = severity_emoji.get(filter_result.max_severity, "⚠️")
+            self.feedback_channel(f"{emoji} Content filtered (severity: {filter_result.max_severity.name})")
+        else:
+            self.feedback_channel("⚠️ Content filtered")
+        return filter_result.filtered_text
+
+    def _classify_stage(self, text: str) -> tuple[str, IntentType]:
+        """Classify intent, dispatch watchdog commands and record context."""
+        intent_result = self.intent_classifier.classify(text)
+        intent = intent_result.primary_intent
+
+        # Handle watchdog commands if detected
+        if intent == IntentType.COMMAND:
+            command_result = self.watchdog_handler.try_handle(text)
+            if command_result is not None and command_result.should_display_in_chat:
+                # Return the command result as processed text
+                return command_result.message, IntentType.COMMAND
+
+        # Add to context history
+        self.context.add_entry(text)
+
+        # Final feedback (skipped entirely when no UI is attached)
+        if self.feedback_channel is not _noop_feedback:
+            confidence_emoji = _CONFIDENCE_EMOJI[intent_result.confidence > HIGH_CONFIDENCE_THRESHOLD]
+            self.feedback_channel(
+                f"{confidence_emoji} Intent: {intent.value} ({intent_result.confidence:.0%} confident)"
+            )
+
+        return text, intent
+
+    def _empty_result(self) -> tuple[str, IntentType]:
+        """Return the result for input that sanitized down to nothing."""
+        if not self.skip_empty_feedback:
+            self.feedback_channel("Empty input - please enter a message")
+        return "", IntentType.UNCLEAR
+
     def run(self, raw: str) -> tuple[str, IntentType]:
         """Process raw input through the sanitization pipeline.
 
@@ -257,60 +387,25 @@ class InputPipeline:
         Raises:
             InputPipelineError: If any stage of the pipeline fails.
         """
+        # Blank input (e.g. a stray enter press) has nothing to sanitize
+        if not raw or raw.isspace():
+            return self._empty_result()
+
         try:
             self._check_rate_limit()
             text = self._sanitize(raw)
 
             if not text:
-                if not self.skip_empty_feedback:
-                    self.feedback_channel("Empty input - please enter a message")
-                return "", IntentType.UNCLEAR
-
-            # Stage 2: Pattern normalization
-            text, pattern_metadata = self.pattern_normalizer.normalize(text)
-            if pattern_metadata.get("changed"):
-                self.feedback_channel("✨ Input normalized")
+                return self._empty_result()
 
-            # Stage 3: LLM-specific escaping
-            text = self.escaper.escape(text)
+            # Stage 2-3: Pattern normalization and LLM-specific escaping
+            text = self._normalize_stage(*self.pattern_normalizer.normalize(text))
 
             # Stage 4: Profanity filtering
-            filter_result = self.profanity_filter.filter(text)
-            if filter_result.has_profanity:
-                severity_emoji = {
-                    Severity.MILD: "😅",
-                    Severity.MODERATE: "⚠️",
-                    Severity.SEVERE: "🚨",
-                    Severity.HATE: "🛑",
-                }
-                if filter_result.max_severity:
-                    emoji = severity_emoji.get(filter_result.max_severity, "⚠️")
-                    self.feedback_channel(f"{emoji} Content filtered (severity: {filter_result.max_severity.name})")
-                else:
-                    self.feedback_channel("⚠️ Content filtered")
-                text = filter_result.filtered_text
-
-            # Stage 5: Intent classification
-            intent_result = self.intent_classifier.classify(text)
-            intent = intent_result.primary_intent
-
-            # Stage 5b: Handle watchdog commands if detected
-            if intent == IntentType.COMMAND and self.watchdog_handler.can_handle(text):
-                command_result = self.watchdog_handler.handle_command(text)
-                if command_result.should_display_in_chat:
-                    # Return the command result as processed text
-                    return command_result.message, IntentType.COMMAND
-
-            # Stage 6: Add to context history
-            self.context.add_entry(text)
-
-            # Final feedback
-            confidence_emoji = "🎯" if intent_result.confidence > HIGH_CONFIDENCE_THRESHOLD else "🤔"
-            self.feedback_channel(
-                f"{confidence_emoji} Intent: {intent.value} ({intent_result.confidence:.0%} confident)"
-            )
+            text = self._filter_profanity_stage(text)
 
-            return text, intent
+            # Stage 5-6: Intent classification, command handling and context
+            return self._classify_stage(text)
 
         except InputPipelineError as e:
             self.feedback_channel(f"Input error: {e}")
@@ -320,6 +415,66 @@ class InputPipeline:
             self.feedback_channel(error_msg)
             raise InputPipelineError(error_msg) from e
 
+    def run_batch(self, raws: list[str]) -> list[tuple[str, IntentType]]:
+        """Process several raw inputs through the pipeline stage by stage.
+
+        Each stage handles the whole batch before the next one starts, so
+        per-stage setup (security summary lookups, normalizer tables) is paid
+        once per batch instead of once per message. Every message still
+        counts against the rate limit.
+
+        Args:
+            raws: Raw user input strings.
+
+        Returns:
+            One ``(text, intent)`` tuple per input, in input order.
+
+        Raises:
+            InputPipelineError: If any stage fails for any message.
+        """
+        try:
+            for _ in raws:
+                self._check_rate_limit()
+
+            if self.enable_enhanced_security and self.enhanced_sanitizer:
+                texts = self._process_enhanced_security_batch(raws)
+            else:
+                texts = [self._validate_input(raw) for raw in raws]
+
+            live = [i for i, text in enumerate(texts) if text]
+            normalized = self.pattern_normalizer.normalize_many([texts[i] for i in live])
+            for i, (text, metadata) in zip(live, normalized, strict=True):
+                texts[i] = self._filter_profanity_stage(self._normalize_stage(text, metadata))
+
+            return [self._classify_stage(text) if text else self._empty_result() for text in texts]
+
+        except InputPipelineError as e:
+            self.feedback_channel(f"Input error: {e}")
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error in input pipeline: {e}"
+            self.feedback_channel(error_msg)
+            raise InputPipelineError(error_msg) from e
+
+    async def run_batch_async(self, raws: list[str]) -> list[tuple[str, IntentType]]:
+        """Run ``run_batch`` in the event loop's default executor.
+
+        The stages are CPU-bound regex work, so an async caller awaits the
+        batch without blocking its loop. Await one call at a time per
+        pipeline; the pipeline's context and counters are not locked.
+
+        Args:
+            raws: Raw user input strings.
+
+        Returns:
+            One ``(text, intent)`` tuple per input, in input order.
+
+        Raises:
+            InputPipelineError: If any stage fails for any message.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run_batch, raws)
+
     def get_conversation_context(self) -> str:
         """Get the current conversation context."""
         return self.context.get_context()
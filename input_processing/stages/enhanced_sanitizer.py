@@ -9,6 +9,7 @@ Integrates XSS, SQL injection, and Unicode attack protection.
 """
 
 import logging
+import threading
 from datetime import datetime
 from typing import Any
 
@@ -85,13 +86,31 @@ class EnhancedInputSanitizer:
     # Attack type constants
     ATTACK_TYPE_SQL_INJECTION = "SQL Injection"
 
-    def __init__(self, logger: logging.Logger | None = None):
-        """Initialize enhanced sanitizer."""
-        self.xss_protection = XSSProtection()
-        self.sql_protection = SQLInjectionProtection()
-        self.unicode_protection = UnicodeProtection()
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        protections_from: "EnhancedInputSanitizer | None" = None,
+    ):
+        """Initialize enhanced sanitizer.
+
+        Args:
+            logger: Optional logger for security events
+            protections_from: Reuse this sanitizer's stateless protection
+                stages; the attack monitor is always this instance's own
+        """
+        if protections_from is None:
+            self.xss_protection = XSSProtection()
+            self.sql_protection = SQLInjectionProtection()
+            self.unicode_protection = UnicodeProtection()
+        else:
+            self.xss_protection = protections_from.xss_protection
+            self.sql_protection = protections_from.sql_protection
+            self.unicode_protection = protections_from.unicode_protection
         self.security_monitor = SecurityMonitor(logger)
         self.logger = logger
+        # Attacks seen by the current sanitize_batch call on each thread; the
+        # monitor's totals cover every call made through this sanitizer
+        self._call_state = threading.local()
 
     def sanitize_input(
         self,
@@ -129,6 +148,38 @@ class EnhancedInputSanitizer:
 
         return sanitized
 
+    def sanitize_batch(
+        self,
+        user_inputs: list[str],
+        context: str = "general",
+        max_length: int | None = None,
+        allow_unicode: bool = True,
+        strict_mode: bool = False,
+    ) -> tuple[list[str], int]:
+        """
+        Sanitize several inputs with shared settings.
+
+        Args:
+            user_inputs: The inputs to sanitize
+            context: Context for sanitization (html, sql, plain, etc.)
+            max_length: Maximum allowed length
+            allow_unicode: Whether to allow Unicode characters
+            strict_mode: Use stricter sanitization rules
+
+        Returns:
+            Sanitized input strings, in input order, and the number of
+            attacks detected in these inputs
+        """
+        self._call_state.attacks = 0
+        sanitize = self.sanitize_input
+        sanitized = [sanitize(text, context, max_length, allow_unicode, strict_mode) for text in user_inputs]
+        return sanitized, self._call_state.attacks
+
+    def _log_attack(self, attack_type: str, payload: str) -> None:
+        """Report an attack to the monitor and count it for the running batch."""
+        self.security_monitor.log_attack_attempt(attack_type, payload)
+        self._call_state.attacks = getattr(self._call_state, "attacks", 0) + 1
+
     def _apply_unicode_protection(
         self,
         user_input: str,
@@ -139,7 +190,7 @@ class EnhancedInputSanitizer:
         """Handle Unicode normalization and attacks."""
         sanitized = self.unicode_protection.sanitize(user_input, allow_unicode=allow_unicode, max_length=max_length)
         if self.unicode_protection.detect_unicode_attack(user_input):
-            self.security_monitor.log_attack_attempt("Unicode", user_input)
+            self._log_attack("Unicode", user_input)
             if strict_mode:
                 sanitized = self.unicode_protection.to_ascii_safe(sanitized)
         return sanitized
@@ -153,11 +204,11 @@ class EnhancedInputSanitizer:
         """Dispatch to context-specific sanitizers."""
         if context == self.context_html:
             if self.xss_protection.detect_xss_attempt(sanitized):
-                self.security_monitor.log_attack_attempt("XSS", sanitized)
+                self._log_attack("XSS", sanitized)
             return self.xss_protection.sanitize(sanitized, allow_html=not strict_mode)
         if context == self.context_sql:
             if self.sql_protection.detect_sql_injection(sanitized):
-                self.security_monitor.log_attack_attempt(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
+                self._log_attack(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
                 if strict_mode:
                     # In strict mode, reject SQL injection attempts
                     raise ValueError("SQL injection attempt detected")
@@ -189,7 +240,7 @@ class EnhancedInputSanitizer:
         strict_mode: bool,
     ) -> str:
         if self.sql_protection.detect_sql_injection(sanitized):
-            self.security_monitor.log_attack_attempt(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
+            self._log_attack(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
             if strict_mode:
                 raise ValueError("SQL injection attempt detected")
         return self.sql_protection.sanitize_sql_input(sanitized)
@@ -212,18 +263,18 @@ class EnhancedInputSanitizer:
     def _sanitize_context_general(self, sanitized: str, strict_mode: bool) -> str:
         # General context - apply all protections
         if EnhancedInputSanitizer._detect_path_traversal(sanitized):
-            self.security_monitor.log_attack_attempt("Path Traversal", sanitized)
+            self._log_attack("Path Traversal", sanitized)
             sanitized = EnhancedInputSanitizer._sanitize_path_traversal(sanitized)
         if EnhancedInputSanitizer._detect_command_injection(sanitized):
-            self.security_monitor.log_attack_attempt("Command Injection", sanitized)
+            self._log_attack("Command Injection", sanitized)
             sanitized = EnhancedInputSanitizer._sanitize_command_injection(sanitized)
         if self.xss_protection.detect_xss_attempt(sanitized):
-            self.security_monitor.log_attack_attempt("XSS", sanitized)
+            self._log_attack("XSS", sanitized)
             sanitized = self.xss_protection.strip_tags(sanitized)
 
         # Check for SQL injection
         if self.sql_protection.detect_sql_injection(sanitized):
-            self.security_monitor.log_attack_attempt(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
+            self._log_attack(self.ATTACK_TYPE_SQL_INJECTION, sanitized)
             sanitized = self.sql_protection.sanitize_sql_input(sanitized)
 
         # Step 3: Final validation
@@ -312,6 +312,18 @@ class PatternNormalizer:
 
         return text, metadata
 
+    def normalize_many(self, texts: list[str]) -> list[tuple[str, dict[str, Any]]]:
+        """Normalize a batch of texts.
+
+        Args:
+            texts: Input texts to normalize
+
+        Returns:
+            List of (normalized_text, metadata_dict) tuples, in input order
+        """
+        normalize = self.normalize
+        return [normalize(text) for text in texts]
+
 
 class FuzzyMatcher:
     """Handles fuzzy string matching for improved UX.
@@ -152,6 +152,38 @@ class RateLimiter:
 
         return status
 
+    def try_acquire(self, key: str, action: str = "default") -> bool:
+        """Record an allowed request without building a RateLimitStatus.
+
+        Only the sliding window strategy has a fast path. When this returns
+        False nothing has been recorded, and the caller should fall back to
+        :meth:`check_rate_limit` to obtain the full status (and message).
+
+        Args:
+            key: Unique identifier (user_id, IP, etc.)
+            action: Type of action being performed
+
+        Returns:
+            True if the request was allowed and recorded
+        """
+        if self.config.strategy != RateLimitStrategy.sliding_window or key in self.penalties:
+            return False
+
+        limit = self.config.action_limits.get(action, self.config.max_requests)
+        now = datetime.now()
+        window_start = now - timedelta(seconds=self.config.window_seconds)
+
+        window = self.sliding_windows[key]
+        while window and window[0] < window_start:
+            window.popleft()
+        if len(window) >= limit:
+            return False
+
+        window.append(now)
+        self.stats["total_requests"] += 1
+        self.stats["unique_users"].add(key)
+        return True
+
     def _check_fixed_window(self, key: str, limit: int) -> RateLimitStatus:
         """Check rate limit using fixed window strategy.
 
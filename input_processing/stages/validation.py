@@ -22,10 +22,135 @@ Example:
 import re
 import string
 import unicodedata
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
 from re import Pattern
+from typing import Any
+
+try:
+    # Optional Aho-Corasick automaton (pyahocorasick) for literal threat strings
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    # Optional linear-time regex engine (google-re2); immune to catastrophic backtracking
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+
+# Every non-anchored dangerous pattern starts with one of these characters
+# (case-insensitive patterns contribute both cases of their first letter).
+_PATTERN_FIRST_CHARS = r"[.\\/%;&|`$<>eEwW\x00-\x08\x0B\x0C\x0E-\x1F\x7F]"
+
+# Inputs longer than this bypass the result cache to bound its memory use.
+_MAX_CACHED_LENGTH = 1024
+
+# Cheap pre-screen: every dangerous pattern needs one of these characters or
+# a ".." run, so text without them (most prose) skips the pattern scan.
+_THREAT_MARKERS = re.compile(r"[\\/%;&|`$<>\x00-\x08\x0B\x0C\x0E-\x1F\x7F]|\.\.")
+
+# RE2 has no lookaround support; these patterns are scanned through a
+# lookaround-free superset and their hits re-verified with ``re``.
+_RE2_SUPERSETS = {
+    r"(?<!\w)[<>]+(?!\w)": r"[<>]+",
+}
+
+# Dangerous control characters (excluding \n, \t, \r). The regex form is
+# kept in ``dangerous_patterns``; detection uses the ``str.translate`` table.
+_CONTROL_CHAR_CLASS = r"[\x01-\x08\x0B\x0C\x0E-\x1F\x7F]"
+_CONTROL_DELETE_TABLE = dict.fromkeys([*range(0x01, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+_CONTROL_DELETE_BYTES = bytes(_CONTROL_DELETE_TABLE)
+
+# Final cleaning pass: DEL and every C0 control character except \n, \r and \t.
+_CLEAN_DELETE_TABLE = dict.fromkeys([*(code for code in range(0x20) if code not in (0x09, 0x0A, 0x0D)), 0x7F])
+_CLEAN_DELETE_BYTES = bytes(_CLEAN_DELETE_TABLE)
+
+# High-threat cleaning keeps only these characters. Non-ASCII code points are
+# all disallowed, so input is narrowed to ASCII and filtered as bytes.
+_HIGH_THREAT_ALLOWED = frozenset(string.ascii_letters + string.digits + " .,!?-_\n\r\t")
+_HIGH_THREAT_DELETE_BYTES = bytes(code for code in range(0x80) if chr(code) not in _HIGH_THREAT_ALLOWED)
+
+# Medium-threat cleaning removes these shell and path metacharacters.
+_MEDIUM_THREAT_DELETE_TABLE = str.maketrans("", "", "&|;`$<>\\\x00")
+
+# Substitutions applied by ``_clean_text``
+_DOTDOT_SLASH = re.compile(r"\.\.[\\/]?")
+_PCT2E_PCT2E = re.compile(r"%2[Ee]%2[Ee]")
+_PCT5C = re.compile(r"%5[Cc]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Upper bound on the literal strings a single pattern may expand to before it
+# is left to the regex engine instead of the literal automaton.
+_MAX_LITERAL_EXPANSIONS = 32
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]()|\\")
+
+
+def _literal_expansions(pattern: Pattern) -> list[str] | None:
+    """Expand a regex that only matches a finite set of literals.
+
+    Handles escaped characters, ``\\xHH`` escapes and simple character
+    classes such as ``[\\/]`` or ``[Ee]``; ``re.IGNORECASE`` is honoured by
+    adding both cases of each letter. Returns ``None`` for anything else,
+    or when the expansion would exceed ``_MAX_LITERAL_EXPANSIONS`` strings.
+    """
+    source = pattern.pattern
+    ignore_case = bool(pattern.flags & re.IGNORECASE)
+    words = [""]
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            if source.startswith("x", i + 1) and re.fullmatch(r"[0-9A-Fa-f]{2}", source[i + 2 : i + 4]):
+                choices = [chr(int(source[i + 2 : i + 4], 16))]
+                i += 4
+            elif i + 1 < len(source) and not source[i + 1].isalnum():
+                choices = [source[i + 1]]
+                i += 2
+            else:
+                return None
+        elif char == "[":
+            end = source.find("]", i + 1)
+            body = source[i + 1 : end] if end != -1 else ""
+            if not body or body.startswith("^") or "-" in body.replace("\\-", ""):
+                return None
+            choices = []
+            j = 0
+            while j < len(body):
+                if body[j] == "\\":
+                    if j + 1 >= len(body) or body[j + 1].isalnum():
+                        return None
+                    choices.append(body[j + 1])
+                    j += 2
+                else:
+                    choices.append(body[j])
+                    j += 1
+            i = end + 1
+        elif char in _REGEX_METACHARS:
+            return None
+        else:
+            choices = [char]
+            i += 1
+
+        if i < len(source) and source[i] in "*+?{":
+            return None
+        if ignore_case:
+            choices = [variant for choice in choices for variant in {choice.lower(), choice.upper()}]
+        words = [word + choice for word in words for choice in dict.fromkeys(choices)]
+        if len(words) > _MAX_LITERAL_EXPANSIONS:
+            return None
+    return words if words != [""] else None
 
 
 class ValidationError(Exception):
@@ -41,6 +166,14 @@ class ThreatLevel(Enum):
     high = auto()
 
 
+# Integer threat levels for hot-path comparisons; converted back to
+# ``ThreatLevel`` once per validation.
+_NONE_V = ThreatLevel.none.value
+_LOW_V = ThreatLevel.low.value
+_MEDIUM_V = ThreatLevel.medium.value
+_HIGH_V = ThreatLevel.high.value
+
+
 @dataclass
 class ValidationResult:
     """
@@ -59,6 +192,160 @@ class ValidationResult:
     issues: list[str] = field(default_factory=list)
 
 
+def _build_dangerous_patterns() -> dict[str, list[tuple[Pattern, ThreatLevel, str]]]:
+    """Build the default dangerous pattern detection regex patterns."""
+    return {
+        "path_traversal": [
+            # Basic path traversal
+            (
+                re.compile(r"\.\.[\\/]"),
+                ThreatLevel.high,
+                "Path traversal attempt: ../",
+            ),
+            (
+                re.compile(r"\.\.\\"),
+                ThreatLevel.high,
+                "Path traversal attempt: ..\\",
+            ),
+            # Any double dots sequence
+            (
+                re.compile(r"\.\."),
+                ThreatLevel.high,
+                "Path traversal sequence detected",
+            ),
+            # Multiple slashes (obfuscation attempt)
+            (
+                re.compile(r"[\\/]{2,}"),
+                ThreatLevel.high,
+                "Multiple slashes detected",
+            ),
+            # Mixed dot/slash runs are covered by the ".." and multiple-slash
+            # rules plus the excessive-character checks
+            # URL encoded path traversal
+            (
+                re.compile(r"\.\.%2[Ff]"),
+                ThreatLevel.high,
+                "URL encoded path traversal: ..%2F",
+            ),
+            (
+                re.compile(r"\.\.%5[Cc]"),
+                ThreatLevel.high,
+                "URL encoded path traversal: ..%5C",
+            ),
+            (re.compile(r"%2[Ee]%2[Ee]"), ThreatLevel.high, "URL encoded dots"),
+            # Double encoded - Fixed ReDoS: use literal matching
+            (
+                re.compile(r"%252e%252e%252f", re.IGNORECASE),
+                ThreatLevel.high,
+                "Double encoded path traversal",
+            ),
+            (re.compile(r"%255[Cc]"), ThreatLevel.high, "Double encoded backslash"),
+            # Unicode/UTF-8 encoded
+            (
+                re.compile(r"\\x2e\\x2e[\\\/]"),
+                ThreatLevel.high,
+                "Hex encoded path traversal",
+            ),
+            (
+                re.compile(r"\\u002e\\u002e"),
+                ThreatLevel.high,
+                "Unicode encoded path traversal",
+            ),
+            # Common sensitive paths
+            (
+                re.compile(r"etc[\\/]passwd", re.IGNORECASE),
+                ThreatLevel.high,
+                "Attempt to access sensitive file",
+            ),
+            (
+                re.compile(r"windows[\\/]system", re.IGNORECASE),
+                ThreatLevel.high,
+                "Windows system directory access",
+            ),
+        ],
+        "command_injection": [
+            # Shell command separators
+            (re.compile(r"[;&|]"), ThreatLevel.high, "Command separator detected"),
+            # Command substitution
+            (re.compile(r"`"), ThreatLevel.high, "Backtick command substitution"),
+            (re.compile(r"\$\("), ThreatLevel.high, "Command substitution: $("),
+            (re.compile(r"\$\{"), ThreatLevel.high, "Variable expansion: ${"),
+            # Process substitution
+            (re.compile(r"<\("), ThreatLevel.high, "Process substitution: <("),
+            (re.compile(r">\("), ThreatLevel.high, "Process substitution: >("),
+            # Redirection
+            (
+                re.compile(r"(?<!\w)[<>]+(?!\w)"),
+                ThreatLevel.medium,
+                "IO redirection detected",
+            ),
+            # Shell variables
+            (
+                re.compile(r"\$[A-Za-z_]"),
+                ThreatLevel.medium,
+                "Shell variable detected",
+            ),
+        ],
+        "null_bytes": [
+            # Direct null byte
+            (re.compile(r"\x00"), ThreatLevel.high, "Null byte detected"),
+            # URL encoded null byte
+            (re.compile(r"%00"), ThreatLevel.high, "URL encoded null byte"),
+            # Double encoded null byte
+            (re.compile(r"%2500"), ThreatLevel.high, "Double encoded null byte"),
+        ],
+        "control_characters": [
+            # Dangerous control characters (excluding \n, \t, \r)
+            (
+                re.compile(_CONTROL_CHAR_CLASS),
+                ThreatLevel.medium,
+                "Control character detected",
+            ),
+        ],
+        "file_system_abuse": [
+            # Absolute paths
+            (
+                re.compile(r"^[A-Za-z]:[\\\/]"),
+                ThreatLevel.medium,
+                "Absolute Windows path",
+            ),
+            (re.compile(r"^[\\\/]"), ThreatLevel.medium, "Absolute Unix path"),
+            # UNC paths
+            (re.compile(r"^\\\\"), ThreatLevel.high, "UNC path detected"),
+            # Device files
+            (
+                re.compile(r"[\\\/]dev[\\\/]"),
+                ThreatLevel.high,
+                "Device file access attempt",
+            ),
+            # Hidden files
+            (re.compile(r"[\\\/]\."), ThreatLevel.low, "Hidden file access"),
+        ],
+    }
+
+
+def _build_reserved_names() -> set[str]:
+    """Build the Windows reserved filename set."""
+    # Windows reserved names
+    base_reserved = {"CON", "PRN", "AUX", "NUL"}
+    # COM1-COM9, LPT1-LPT9
+    com_ports = {f"COM{i}" for i in range(1, 10)}
+    lpt_ports = {f"LPT{i}" for i in range(1, 10)}
+
+    return base_reserved | com_ports | lpt_ports
+
+
+# The pre-screen and first-character lookahead above are only valid for the
+# built-in patterns; registering any other pattern disables them.
+_BUILTIN_PATTERN_KEYS = frozenset(
+    (pattern.pattern, pattern.flags) for patterns in _build_dangerous_patterns().values() for pattern, _, _ in patterns
+)
+
+# A whole filename-like token whose stem (text before the first dot) is a
+# reserved name, e.g. "con", "LPT1" or "nul.txt.bak"
+_RESERVED_NAME_TEMPLATE = r"(?<![A-Za-z0-9_\-.])(?:{names})(?:\.[A-Za-z0-9_\-.]*)?(?![A-Za-z0-9_\-.])"
+
+
 class InputValidator:
     """
     Validates and sanitizes user input for security threats.
@@ -67,13 +354,22 @@ class InputValidator:
     of path traversal attempts, command injection, null bytes, control
     characters, and Windows reserved filenames.
 
+    Patterns, derived matchers and the result cache are class-level state
+    built once at import, so constructing a validator is cheap.
+
     Attributes:
         max_length: Maximum allowed input length (default: 5000)
-        dangerous_patterns: Dictionary of pattern categories and their regex
-            patterns
-        windows_reserved: Set of Windows reserved filenames
+        dangerous_patterns: Class-level dictionary of pattern categories and
+            their regex patterns
+        windows_reserved: Class-level set of Windows reserved filenames
     """
 
+    dangerous_patterns: dict[str, list[tuple[Pattern, ThreatLevel, str]]] = _build_dangerous_patterns()
+    windows_reserved: set[str] = _build_reserved_names()
+
+    # Number of recent validation results memoized per class
+    result_cache_size = 4096
+
     def __init__(self, max_length: int = 5000):
         """
         Initialize the InputValidator with configurable settings.
@@ -82,155 +378,177 @@ class InputValidator:
             max_length: Maximum allowed input length (default: 5000)
         """
         self.max_length = max_length
-        self._initialize_patterns()
-        self._initialize_reserved_names()
-
-    def _initialize_patterns(self) -> None:
-        """Initialize dangerous pattern detection regex patterns."""
-        self.dangerous_patterns: dict[str, list[tuple[Pattern, ThreatLevel, str]]] = {
-            "path_traversal": [
-                # Basic path traversal
-                (
-                    re.compile(r"\.\.[\\/]"),
-                    ThreatLevel.high,
-                    "Path traversal attempt: ../",
-                ),
-                (
-                    re.compile(r"\.\.\\"),
-                    ThreatLevel.high,
-                    "Path traversal attempt: ..\\",
-                ),
-                # Any double dots sequence
-                (
-                    re.compile(r"\.\."),
-                    ThreatLevel.high,
-                    "Path traversal sequence detected",
-                ),
-                # Multiple slashes (obfuscation attempt)
-                (
-                    re.compile(r"[\\/]{2,}"),
-                    ThreatLevel.high,
-                    "Multiple slashes detected",
-                ),
-                # Mixed slashes with dots - Two-part detection: relaxed pattern + excessive char check
-                (
-                    re.compile(r"\.{2,}[\\/]+\.{2,}"),
-                    ThreatLevel.high,
-                    "Path traversal pattern detected",
-                ),
-                # URL encoded path traversal
-                (
-                    re.compile(r"\.\.%2[Ff]"),
-                    ThreatLevel.high,
-                    "URL encoded path traversal: ..%2F",
-                ),
-                (
-                    re.compile(r"\.\.%5[Cc]"),
-                    ThreatLevel.high,
-                    "URL encoded path traversal: ..%5C",
-                ),
-                (re.compile(r"%2[Ee]%2[Ee]"), ThreatLevel.high, "URL encoded dots"),
-                # Double encoded - Fixed ReDoS: use literal matching
-                (
-                    re.compile(r"%252e%252e%252f", re.IGNORECASE),
-                    ThreatLevel.high,
-                    "Double encoded path traversal",
-                ),
-                (re.compile(r"%255[Cc]"), ThreatLevel.high, "Double encoded backslash"),
-                # Unicode/UTF-8 encoded
-                (
-                    re.compile(r"\\x2e\\x2e[\\\/]"),
-                    ThreatLevel.high,
-                    "Hex encoded path traversal",
-                ),
-                (
-                    re.compile(r"\\u002e\\u002e"),
-                    ThreatLevel.high,
-                    "Unicode encoded path traversal",
-                ),
-                # Common sensitive paths
-                (
-                    re.compile(r"etc[\\/]passwd", re.IGNORECASE),
-                    ThreatLevel.high,
-                    "Attempt to access sensitive file",
-                ),
-                (
-                    re.compile(r"windows[\\/]system", re.IGNORECASE),
-                    ThreatLevel.high,
-                    "Windows system directory access",
-                ),
-            ],
-            "command_injection": [
-                # Shell command separators
-                (re.compile(r"[;&|]"), ThreatLevel.high, "Command separator detected"),
-                # Command substitution
-                (re.compile(r"`"), ThreatLevel.high, "Backtick command substitution"),
-                (re.compile(r"\$\("), ThreatLevel.high, "Command substitution: $("),
-                (re.compile(r"\$\{"), ThreatLevel.high, "Variable expansion: ${"),
-                # Process substitution
-                (re.compile(r"<\("), ThreatLevel.high, "Process substitution: <("),
-                (re.compile(r">\("), ThreatLevel.high, "Process substitution: >("),
-                # Redirection
-                (
-                    re.compile(r"(?<!\w)[<>]+(?!\w)"),
-                    ThreatLevel.medium,
-                    "IO redirection detected",
-                ),
-                # Shell variables
-                (
-                    re.compile(r"\$[A-Za-z_]"),
-                    ThreatLevel.medium,
-                    "Shell variable detected",
-                ),
-            ],
-            "null_bytes": [
-                # Direct null byte
-                (re.compile(r"\x00"), ThreatLevel.high, "Null byte detected"),
-                # URL encoded null byte
-                (re.compile(r"%00"), ThreatLevel.high, "URL encoded null byte"),
-                # Double encoded null byte
-                (re.compile(r"%2500"), ThreatLevel.high, "Double encoded null byte"),
-            ],
-            "control_characters": [
-                # Dangerous control characters (excluding \n, \t, \r)
-                (
-                    re.compile(r"[\x01-\x08\x0B\x0C\x0E-\x1F\x7F]"),
-                    ThreatLevel.medium,
-                    "Control character detected",
-                ),
-            ],
-            "file_system_abuse": [
-                # Absolute paths
-                (
-                    re.compile(r"^[A-Za-z]:[\\\/]"),
-                    ThreatLevel.medium,
-                    "Absolute Windows path",
-                ),
-                (re.compile(r"^[\\\/]"), ThreatLevel.medium, "Absolute Unix path"),
-                # UNC paths
-                (re.compile(r"^\\\\"), ThreatLevel.high, "UNC path detected"),
-                # Device files
-                (
-                    re.compile(r"[\\\/]dev[\\\/]"),
-                    ThreatLevel.high,
-                    "Device file access attempt",
-                ),
-                # Hidden files
-                (re.compile(r"[\\\/]\."), ThreatLevel.low, "Hidden file access"),
-            ],
-        }
-
-    def _initialize_reserved_names(self) -> None:
-        """Initialize Windows reserved filename set."""
-        # Windows reserved names
-        base_reserved = {"CON", "PRN", "AUX", "NUL"}
-        # COM1-COM9, LPT1-LPT9
-        com_ports = {f"COM{i}" for i in range(1, 10)}
-        lpt_ports = {f"LPT{i}" for i in range(1, 10)}
-
-        self.windows_reserved: set[str] = base_reserved | com_ports | lpt_ports
-
-    def validate(self, text: str) -> ValidationResult:
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each subclass its own matchers and result cache."""
+        super().__init_subclass__(**kwargs)
+        cls._build_combined_pattern()
+
+    @classmethod
+    def register_pattern(cls, category: str, pattern: Pattern, level: ThreatLevel, description: str) -> None:
+        """
+        Add a dangerous pattern to this class and rebuild its matchers.
+
+        The pattern list is copied on first registration, so patterns added
+        to a subclass do not leak into its parent.
+
+        Args:
+            category: Pattern category, e.g. "command_injection"
+            pattern: Compiled regex to detect
+            level: Threat level reported when the pattern matches
+            description: Human-readable issue description
+        """
+        if "dangerous_patterns" not in cls.__dict__:
+            cls.dangerous_patterns = {name: list(entries) for name, entries in cls.dangerous_patterns.items()}
+        cls.dangerous_patterns.setdefault(category, []).append((pattern, level, description))
+        cls._build_combined_pattern()
+
+    def clear_cache(self) -> None:
+        """Rebuild derived pattern state and drop memoized results.
+
+        Call this after mutating ``dangerous_patterns`` in place; prefer
+        ``register_pattern`` for adding patterns.
+        """
+        type(self)._build_combined_pattern()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss/size statistics for the validation result cache."""
+        info = self._validate_cached.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "maxsize": info.maxsize or 0, "currsize": info.currsize}
+
+    @classmethod
+    def _build_combined_pattern(cls) -> None:
+        """Union all dangerous patterns into a single named-alternation regex.
+
+        One ``finditer`` pass over the input tells whether anything matched
+        at all and classifies the matches it reports. Because alternation
+        matches do not overlap, a pattern that was not reported may still
+        match elsewhere, so those are re-checked individually - but only
+        when the combined pass found something.
+
+        When pyahocorasick is installed, patterns that only match a fixed set
+        of strings are moved out of the regex into one literal automaton.
+        """
+        extra_patterns = [
+            # Excessive consecutive characters (ReDoS mitigation)
+            (re.compile(r"\.{6,}"), ThreatLevel.high, "Excessive consecutive dots detected"),
+            (re.compile(r"[\\/]{4,}"), ThreatLevel.high, "Excessive consecutive slashes detected"),
+        ]
+        entries = [
+            (category, pattern, level, description)
+            for category, patterns in cls.dangerous_patterns.items()
+            for pattern, level, description in patterns
+        ]
+        entries += [("path_traversal", pattern, level, description) for pattern, level, description in extra_patterns]
+        cls._prescreen = all(
+            (pattern.pattern, pattern.flags) in _BUILTIN_PATTERN_KEYS
+            for patterns in cls.dangerous_patterns.values()
+            for pattern, _, _ in patterns
+        )
+
+        cls._pattern_table: list[tuple[str, Pattern, int, str, str]] = []
+        floating: list[str] = []
+        anchored: list[str] = []
+        re2_alternatives: list[str] = []
+        # The same literal can belong to several patterns (e.g. "..\\")
+        literal_groups: dict[str, list[str]] = {}
+        # Groups whose detection below is exhaustive need no individual re-check
+        cls._exact_groups: set[str] = set()
+        cls._control_group: str | None = None
+        for index, (category, pattern, level, description) in enumerate(entries):
+            group = f"g{index}"
+            cls._pattern_table.append((group, pattern, level.value, category, f"{category}: {description}"))
+            if pattern.pattern == _CONTROL_CHAR_CLASS and cls._control_group is None:
+                cls._control_group = group
+                cls._exact_groups.add(group)
+                continue
+            literals = _literal_expansions(pattern) if AHOCORASICK_AVAILABLE else None
+            if literals:
+                for literal in literals:
+                    literal_groups.setdefault(literal, []).append(group)
+                cls._exact_groups.add(group)
+                continue
+            scope = "(?i:" if pattern.flags & re.IGNORECASE else "(?:"
+            alternative = f"(?P<{group}>{scope}{pattern.pattern}))"
+            (anchored if pattern.pattern.startswith("^") else floating).append(alternative)
+            re2_alternatives.append(f"{scope}{_RE2_SUPERSETS.get(pattern.pattern, pattern.pattern)})")
+
+        cls._literal_automaton: Any = None
+        if literal_groups:
+            cls._literal_automaton = ahocorasick.Automaton()
+            for literal, groups in literal_groups.items():
+                cls._literal_automaton.add_word(literal, tuple(groups))
+            cls._literal_automaton.make_automaton()
+
+        # Prefer a linear-time RE2 gate when the engine is installed. It has no
+        # capture groups: building RE2 match objects with groups is costly.
+        cls._re2_pattern: Any = None
+        if RE2_AVAILABLE and re2_alternatives:
+            try:
+                cls._re2_pattern = re2.compile("|".join(re2_alternatives))
+            except re2.error:
+                cls._re2_pattern = None
+
+        lookahead = f"(?={_PATTERN_FIRST_CHARS})" if cls._prescreen else ""
+        # The leading lookahead lets the regex engine skip straight to candidate
+        # positions; without it, every alternative is tried at every offset.
+        cls._combined_pattern: Pattern | None = (
+            re.compile(f"{lookahead}(?:{'|'.join(floating)})") if floating else None
+        )
+        # Start-anchored patterns can only match at offset 0.
+        cls._anchored_pattern: Pattern | None = re.compile("|".join(anchored)) if anchored else None
+
+        # One alternation of the reserved names replaces per-token set lookups
+        names = "|".join(re.escape(name) for name in sorted(cls.windows_reserved, key=len, reverse=True))
+        cls._reserved_pattern: Pattern | None = (
+            re.compile(_RESERVED_NAME_TEMPLATE.format(names=names), re.IGNORECASE | re.ASCII) if names else None
+        )
+
+        # Cached results depend on the patterns, so each rebuild starts afresh
+        cls._validate_cached = staticmethod(lru_cache(maxsize=cls.result_cache_size)(cls._validate_uncached))
+
+    @classmethod
+    def _scan_patterns(cls, text: str) -> set[str]:
+        """Return the groups of patterns known to match ``text``.
+
+        An empty result means no dangerous pattern matches anywhere; patterns
+        absent from a non-empty result still have to be checked individually.
+        """
+        if cls._prescreen and not _THREAT_MARKERS.search(text):
+            return set()
+
+        hits: set[str] = set()
+        if cls._control_group is not None:
+            # bytes.translate with a delete set beats the str mapping table
+            if text.isascii():
+                stripped_length = len(text.encode("ascii").translate(None, _CONTROL_DELETE_BYTES))
+            else:
+                stripped_length = len(text.translate(_CONTROL_DELETE_TABLE))
+            if stripped_length != len(text):
+                hits.add(cls._control_group)
+        if cls._literal_automaton is not None:
+            for _, groups in cls._literal_automaton.iter(text):
+                hits.update(groups)
+
+        if cls._re2_pattern is not None:
+            try:
+                # Something matched: a non-empty result with no known groups
+                # makes callers classify every pattern with ``re``.
+                if cls._re2_pattern.search(text):
+                    hits.add("")
+                return hits
+            except UnicodeEncodeError:
+                # RE2 works on UTF-8; lone surrogates fall back to ``re``
+                pass
+
+        if cls._combined_pattern is not None:
+            hits.update(match.lastgroup for match in cls._combined_pattern.finditer(text))
+        anchored_match = cls._anchored_pattern.match(text) if cls._anchored_pattern is not None else None
+        if anchored_match:
+            hits.add(anchored_match.lastgroup)
+        return hits
+
+    def validate(self, text: str, stop_on_high: bool = False) -> ValidationResult:
         """
         Validate input text for security threats.
 
@@ -240,6 +558,9 @@ class InputValidator:
 
         Args:
             text: Input text to validate
+            stop_on_high: Stop collecting issues at the first high-severity
+                match. Validity, threat level and cleaned text are unchanged;
+                only the issue list may be shorter.
 
         Returns:
             ValidationResult containing validation status, cleaned text,
@@ -251,64 +572,137 @@ class InputValidator:
         if not isinstance(text, str):
             raise ValidationError(f"Input must be string, got {type(text).__name__}")
 
+        # Repeated inputs (usernames, templates, paths) reuse the previous verdict
+        if len(text) <= _MAX_CACHED_LENGTH:
+            is_valid, cleaned_text, threat_level, issues = self._validate_cached(text, self.max_length, stop_on_high)
+        else:
+            is_valid, cleaned_text, threat_level, issues = self._validate_uncached(text, self.max_length, stop_on_high)
+
+        return ValidationResult(
+            is_valid=is_valid,
+            cleaned_text=cleaned_text,
+            threat_level=threat_level,
+            issues=list(issues),
+        )
+
+    def compile(self) -> Callable[[str], ValidationResult]:
+        """
+        Return a ``validate`` function specialised for this validator.
+
+        The returned closure binds ``max_length``, the result cache and the
+        validation routine as local variables, saving the attribute lookups
+        ``validate`` performs on every call. Recompile after
+        ``register_pattern`` or ``clear_cache``; a compiled function keeps
+        using the matchers that existed when it was created.
+
+        Returns:
+            Function taking the input text and returning a ValidationResult
+        """
+        max_length = self.max_length
+        cached = type(self)._validate_cached
+        uncached = type(self)._validate_uncached
+        cache_limit = _MAX_CACHED_LENGTH
+        result_type = ValidationResult
+
+        def fast_validate(text: str) -> ValidationResult:
+            if not isinstance(text, str):
+                raise ValidationError(f"Input must be string, got {type(text).__name__}")
+            run = cached if len(text) <= cache_limit else uncached
+            is_valid, cleaned_text, threat_level, issues = run(text, max_length, False)
+            return result_type(
+                is_valid=is_valid,
+                cleaned_text=cleaned_text,
+                threat_level=threat_level,
+                issues=list(issues),
+            )
+
+        return fast_validate
+
+    def is_threat(self, text: str) -> bool:
+        """
+        Check whether text would fail validation.
+
+        Cheaper than ``validate`` for accept/reject decisions because the
+        scan stops at the first high-severity match.
+
+        Args:
+            text: Input text to check
+
+        Returns:
+            True if the input is not valid, False otherwise
+        """
+        return not self.validate(text, stop_on_high=True).is_valid
+
+    @classmethod
+    def _validate_uncached(
+        cls, text: str, max_length: int, stop_on_high: bool = False
+    ) -> tuple[bool, str, ThreatLevel, tuple[str, ...]]:
+        """
+        Run the full validation and return an immutable result tuple.
+
+        Args:
+            text: Input text to validate
+            max_length: Maximum allowed input length
+            stop_on_high: Stop collecting issues at the first high-severity match
+
+        Returns:
+            Tuple of (is_valid, cleaned_text, threat_level, issues)
+        """
         issues: list[str] = []
-        threat_level = ThreatLevel.none
+        threat_int = _NONE_V
 
         # Length validation
-        if len(text) > self.max_length:
-            issues.append(f"Input exceeds maximum length of {self.max_length} characters")
-            threat_level = ThreatLevel.medium
-            text = text[: self.max_length]
+        if len(text) > max_length:
+            issues.append(f"Input exceeds maximum length of {max_length} characters")
+            threat_int = _MEDIUM_V
+            text = text[:max_length]
 
         # Check for empty or whitespace-only input
         if not text or text.isspace():
-            return ValidationResult(is_valid=True, cleaned_text="", threat_level=ThreatLevel.none, issues=[])
-
-        # Pattern-based threat detection
-        for category, patterns in self.dangerous_patterns.items():
-            for pattern, level, description in patterns:
-                if pattern.search(text):
-                    issues.append(f"{category}: {description}")
-                    threat_level = max(threat_level, level, key=lambda x: x.value)
-
-        # Additional check for excessive consecutive characters (ReDoS mitigation)
-        if re.search(r"\.{6,}", text):  # More than 5 consecutive dots
-            issues.append("path_traversal: Excessive consecutive dots detected")
-            threat_level = max(threat_level, ThreatLevel.high, key=lambda x: x.value)
-        if re.search(r"[\\/]{4,}", text):  # More than 3 consecutive slashes
-            issues.append("path_traversal: Excessive consecutive slashes detected")
-            threat_level = max(threat_level, ThreatLevel.high, key=lambda x: x.value)
+            return True, "", ThreatLevel.none, ()
+
+        # Pattern-based threat detection (single pass over the input)
+        matched_categories: set[str] = set()
+        hits = cls._scan_patterns(text)
+        if hits:
+            for group, pattern, level, category, issue in cls._pattern_table:
+                if group in hits or (group not in cls._exact_groups and pattern.search(text)):
+                    issues.append(issue)
+                    matched_categories.add(category)
+                    if level > threat_int:
+                        threat_int = level
+                        if stop_on_high and threat_int >= _HIGH_V:
+                            break
+
+        # The remaining checks cannot raise the level past high
+        stop = stop_on_high and threat_int >= _HIGH_V
 
         # Windows reserved filename check
-        # Check both the full text and any potential filename components
-        potential_filenames = re.findall(r"[A-Za-z0-9_\-\.]+", text)
-        for filename in potential_filenames:
-            base_name = filename.upper().split(".")[0]
-            if base_name in self.windows_reserved:
-                issues.append(f"Windows reserved filename detected: {filename}")
-                threat_level = max(threat_level, ThreatLevel.medium, key=lambda x: x.value)
-
-        # Unicode normalization check
-        normalized = unicodedata.normalize("NFKC", text)
-        if normalized != text:
+        if not stop and cls._reserved_pattern is not None:
+            for match in cls._reserved_pattern.finditer(text):
+                issues.append(f"Windows reserved filename detected: {match.group()}")
+                if threat_int < _MEDIUM_V:
+                    threat_int = _MEDIUM_V
+
+        # Unicode normalization check; NFKC never changes pure ASCII text, and
+        # the quick check avoids building the normalized copy
+        if not stop and not text.isascii() and not unicodedata.is_normalized("NFKC", text):
             issues.append("Unicode normalization changed input (possible obfuscation)")
-            threat_level = max(threat_level, ThreatLevel.low, key=lambda x: x.value)
+            if threat_int < _LOW_V:
+                threat_int = _LOW_V
+
+        threat_level = ThreatLevel(threat_int)
 
         # Clean the text if threats were detected
-        cleaned_text = InputValidator._clean_text(text, threat_level) if issues else text
+        cleaned_text = cls._clean_text(text, threat_level, frozenset(matched_categories)) if issues else text
 
         # Determine validity
-        is_valid = threat_level.value <= ThreatLevel.low.value
+        is_valid = threat_int <= _LOW_V
 
-        return ValidationResult(
-            is_valid=is_valid,
-            cleaned_text=cleaned_text,
-            threat_level=threat_level,
-            issues=issues,
-        )
+        return is_valid, cleaned_text, threat_level, tuple(issues)
 
     @staticmethod
-    def _clean_text(text: str, threat_level: ThreatLevel) -> str:
+    def _clean_text(text: str, threat_level: ThreatLevel, matched_categories: frozenset[str] = frozenset()) -> str:
         """
         Clean dangerous content from text based on threat level.
 
@@ -319,37 +713,42 @@ class InputValidator:
         Args:
             text: Text to clean
             threat_level: Detected threat level
+            matched_categories: Pattern categories that matched during
+                validation
 
         Returns:
             Cleaned text with dangerous content removed or escaped
         """
-        if threat_level == ThreatLevel.high:
+        threat_int = threat_level.value
+        if threat_int == _HIGH_V:
             # Aggressive cleaning for high threats
             # For path traversal, completely reject the input
-            if any(pattern in text.lower() for pattern in ["..", "etc/passwd", "windows/system", "cmd.exe"]):
-                return ""  # Completely reject path traversal attempts
+            # ("..", etc/passwd and windows/system all match path_traversal
+            # patterns, so only cmd.exe needs its own check)
+            if "path_traversal" in matched_categories or "cmd.exe" in text.lower():
+                return ""
             # Remove special chars except basic punctuation and whitespace
-            allowed = string.ascii_letters + string.digits + " .,!?-_\n\r\t"
-            allowed_chars = set(allowed)
-            cleaned = "".join(c for c in text if c in allowed_chars)
-        elif threat_level == ThreatLevel.medium:
+            cleaned = text.encode("ascii", "ignore").translate(None, _HIGH_THREAT_DELETE_BYTES).decode("ascii")
+        elif threat_int == _MEDIUM_V:
             # Moderate cleaning
             # Remove dangerous characters but preserve more formatting
-            dangerous_chars = {"&", "|", ";", "`", "$", "<", ">", "\\", "\x00"}
-            cleaned = "".join(c for c in text if c not in dangerous_chars)
+            cleaned = text.translate(_MEDIUM_THREAT_DELETE_TABLE)
             # Remove path traversal sequences
-            cleaned = re.sub(r"\.\.[\\/]?", "", cleaned)
-            cleaned = re.sub(r"%2[Ee]%2[Ee]", "", cleaned)
-            cleaned = re.sub(r"%5[Cc]", "", cleaned)
+            cleaned = _DOTDOT_SLASH.sub("", cleaned)
+            cleaned = _PCT2E_PCT2E.sub("", cleaned)
+            cleaned = _PCT5C.sub("", cleaned)
         else:
             # Light cleaning for low threats
             # Just remove null bytes and normalize whitespace
             cleaned = text.replace("\x00", "").replace("%00", "")
             # Normalize multiple spaces
-            cleaned = re.sub(r"\s+", " ", cleaned)
+            cleaned = _WHITESPACE.sub(" ", cleaned)
 
         # Final safety: ensure no control characters remain
-        cleaned = "".join(c for c in cleaned if c in {"\n", "\r", "\t"} or ord(c) >= 32)
+        if cleaned.isascii():
+            cleaned = cleaned.encode("ascii").translate(None, _CLEAN_DELETE_BYTES).decode("ascii")
+        else:
+            cleaned = cleaned.translate(_CLEAN_DELETE_TABLE)
 
         return cleaned.strip()
 
@@ -372,8 +771,11 @@ class InputValidator:
         try:
             base = Path(base_dir).resolve()
             candidate = (base / user_path).resolve()
-            # This will raise ValueError if candidate is not relative to base
-            candidate.relative_to(base)
-            return True
         except (ValueError, OSError):
+            # Unresolvable paths (e.g. embedded null bytes) are never safe
             return False
+        return candidate.is_relative_to(base)
+
+
+# Build the shared matchers and result cache once at import
+InputValidator._build_combined_pattern()
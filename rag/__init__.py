@@ -39,6 +39,7 @@ __all__ = [
     "FileMonitor",
     # Utilities
     "DirectoryValidator",
+    "ExtractionResult",
     "SecureTextExtractor",
     "create_secure_text_extractor",
     "extract_text_secure",
@@ -58,6 +59,7 @@ if TYPE_CHECKING:
     from .optimized_file_processor import OptimizedFileProcessor
     from .optimized_vector_search import OptimizedVectorSearchEngine
     from .secure_text_extractor import (
+        ExtractionResult,
         SecureTextExtractor,
         create_secure_text_extractor,
         extract_text_secure,
@@ -94,6 +96,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "FileMonitor": ("rag.file_monitor", "FileMonitor"),
     # Utilities
     "DirectoryValidator": ("rag.directory_validator", "DirectoryValidator"),
+    "ExtractionResult": (_SECURE_TEXT_EXTRACTOR_MODULE, "ExtractionResult"),
     "SecureTextExtractor": (_SECURE_TEXT_EXTRACTOR_MODULE, "SecureTextExtractor"),
     "create_secure_text_extractor": (
         _SECURE_TEXT_EXTRACTOR_MODULE,
@@ -8,15 +8,196 @@ It serves as the integration point between the RAG system and safe text extracti
 utilities for various file formats.
 """
 
+import codecs
+import concurrent.futures
+import hashlib
+import io
 import logging
+import mmap
+import os
+import re
+import signal
+import stat
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from utils import SafePDFProcessor
+try:
+    import charset_normalizer
+
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    charset_normalizer = None
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from utils import SafePDFProcessor
 
 logger = logging.getLogger(__name__)
 
+# Extensions handled by the plain text reader
+_PLAIN_TEXT_EXTS = frozenset({".txt", ".md", ".py", ".js", ".html", ".json", ".csv"})
+
+# Plain text read limit when the caller passes no max_size
+_DEFAULT_TEXT_SIZE_LIMIT = 10 * 1024 * 1024
+
+# Block size used when hashing file contents
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Read buffer for plain text files: one large read and one decode instead of
+# TextIOWrapper's 8 KiB chunks
+_TEXT_READ_BUFFER = 8 * 1024 * 1024
+
+# Files larger than this are memory-mapped and decoded in place, skipping the
+# copy into a bytes object; smaller files are cheaper to read directly
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Window size used when streaming large text files
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
+# Leading bytes read to recognise a PDF before handing it to the PDF parser
+_PDF_MAGIC = b"%PDF-"
+_PDF_SNIFF_BYTES = 1024
+
+# HTML pre-clean: script/style blocks carry no searchable text; collapsing
+# runs of indentation is opt-in because it also rewrites <pre> content
+_HTML_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.S | re.I)
+_WS_RE = re.compile(r"[ \t]+")
+
+
+@cache
+def _safe_pdf_processor_class() -> type["SafePDFProcessor"] | None:
+    """Import SafePDFProcessor on first use; None when it cannot be imported."""
+    try:
+        from utils import SafePDFProcessor
+    except ImportError:
+        return None
+    return SafePDFProcessor
+
+
+def _create_pdf_processor(timeout: int, max_pages: int, max_file_size: int) -> "SafePDFProcessor":
+    """Create a SafePDFProcessor, raising ImportError when PDF support is missing."""
+    processor_class = _safe_pdf_processor_class()
+    if processor_class is None:
+        raise ImportError("SafePDFProcessor is not available")
+    return processor_class(timeout=timeout, max_pages=max_pages, max_file_size=max_file_size)
+
+
+# One SafePDFProcessor per worker process of the PDF process pool
+_worker_pdf_processor: "SafePDFProcessor | None" = None
+
+
+class _PDFWorkerTimeout(BaseException):
+    """PDF worker alarm; a BaseException so the parser's ``except Exception`` cannot swallow it."""
+
+
+def _raise_pdf_worker_timeout(signum: int, frame: Any) -> None:
+    """SIGALRM handler used while a PDF worker extracts a file."""
+    raise _PDFWorkerTimeout
+
+
+def _pdf_timeout_result(timeout: int) -> dict[str, Any]:
+    """Extraction result for a PDF that hit the worker time limit."""
+    return {
+        "success": False,
+        "text": "",
+        "warnings": [],
+        "error": f"PDF processing timed out after {timeout} seconds",
+    }
+
+
+def _extract_pdf_in_worker(file_path: str, timeout: int, max_pages: int, max_file_size: int) -> dict[str, Any]:
+    """Extract a PDF inside a pool worker, reusing the worker's processor.
+
+    The clock starts when the worker picks the job up, so time spent queued
+    behind other PDFs does not count. Where SIGALRM exists the limit is hard:
+    the alarm interrupts a parse stuck inside a single page and only this job
+    fails. Elsewhere SafePDFProcessor's cooperative timeout applies.
+    """
+    global _worker_pdf_processor
+    if _worker_pdf_processor is None:
+        _worker_pdf_processor = _create_pdf_processor(timeout, max_pages, max_file_size)
+    if not hasattr(signal, "setitimer"):
+        return _worker_pdf_processor.extract_text(file_path)
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_pdf_worker_timeout)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        result = _worker_pdf_processor.extract_text(file_path)
+        # Disarm inside the try, so an alarm landing just after extraction is
+        # still turned into a result instead of escaping through ``finally``
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        return result
+    except _PDFWorkerTimeout:
+        return _pdf_timeout_result(timeout)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _as_path(file_path: str | os.PathLike[str]) -> Path:
+    """Return ``file_path`` as a Path, without re-parsing one that already is."""
+    # Path() instances are concrete PosixPath/WindowsPath objects, so an
+    # identity check against Path itself would never match
+    return file_path if isinstance(file_path, Path) else Path(file_path)
+
+
+def _suffix_lower(file_path: str | os.PathLike[str]) -> str:
+    """Return the lower-cased extension of ``file_path`` without building a Path."""
+    return os.path.splitext(os.fspath(file_path))[1].lower()
+
+
+def _clean_html(text: str, *, collapse_whitespace: bool = False) -> str:
+    """Drop script/style blocks from HTML, optionally collapsing runs of spaces and tabs."""
+    text = _HTML_SCRIPT_RE.sub("", text)
+    return _WS_RE.sub(" ", text) if collapse_whitespace else text
+
+
+def _content_hash(file_path: Path) -> str:
+    """Return the hex SHA-256 of a file, streamed in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class ExtractionResult:
+    """Outcome of extracting text from one file."""
+
+    success: bool = False
+    text: str = ""
+    file_type: str = "unknown"
+    processing_time: float = 0.0
+    warnings: list[str] = field(default_factory=list)
+    error: str | None = None
+    pages_processed: int = 0
+    total_pages: int = 0
+    # Lazily decoded chunks of a streamed plain text file; ``text`` is then empty
+    text_iter: Iterator[str] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to the dictionary form used at API boundaries."""
+        result = {
+            "success": self.success,
+            "text": self.text,
+            "file_type": self.file_type,
+            "processing_time": self.processing_time,
+            "warnings": self.warnings,
+            "error": self.error,
+            "pages_processed": self.pages_processed,
+            "total_pages": self.total_pages,
+        }
+        if self.text_iter is not None:
+            result["text_iter"] = self.text_iter
+        return result
+
 
 class SecureTextExtractor:
     """
@@ -37,12 +218,21 @@ class SecureTextExtractor:
         ".csv": "csv",
     }
 
+    # get_supported_extensions results, with and without PDF support
+    _extensions_with_pdf = tuple(supported_extensions)
+    _extensions_without_pdf = tuple(ext for ext in supported_extensions if ext != ".pdf")
+
     def __init__(
         self,
         pdf_timeout: int = 30,
         pdf_max_pages: int = 1000,
         pdf_max_file_size: int = 50 * 1024 * 1024,  # 50MB
         enable_pdf_extraction: bool = True,
+        result_cache_size: int = 256,
+        pdf_worker_processes: int = 0,
+        stream_threshold: int | None = None,
+        collect_timing: bool = False,
+        collapse_html_whitespace: bool = False,
     ):
         """
         Initialize SecureTextExtractor with security limits.
@@ -52,20 +242,31 @@ class SecureTextExtractor:
             pdf_max_pages: Maximum pages to process from PDF
             pdf_max_file_size: Maximum PDF file size (bytes)
             enable_pdf_extraction: Whether to enable PDF extraction
+            result_cache_size: Number of extraction results kept by content
+                hash so unchanged files are not re-extracted (0 disables)
+            pdf_worker_processes: Extract PDFs in a persistent pool of this
+                many worker processes with a hard per-file timeout
+                (0 extracts in-process)
+            stream_threshold: Plain text files larger than this many bytes
+                are returned as a lazy ``text_iter`` of decoded chunks
+                instead of a single ``text`` string (None disables)
+            collect_timing: Measure each extraction's ``processing_time``
+                (left at 0.0 otherwise)
+            collapse_html_whitespace: Collapse runs of spaces and tabs in
+                non-streamed .html text, including inside <pre> blocks
         """
         self.pdf_timeout = pdf_timeout
         self.pdf_max_pages = pdf_max_pages
         self.pdf_max_file_size = pdf_max_file_size
         self.enable_pdf_extraction = enable_pdf_extraction
+        self.stream_threshold = stream_threshold
+        self.collect_timing = collect_timing
+        self.collapse_html_whitespace = collapse_html_whitespace
 
         # Initialize PDF processor if enabled
         if enable_pdf_extraction:
             try:
-                self.pdf_processor = SafePDFProcessor(
-                    timeout=pdf_timeout,
-                    max_pages=pdf_max_pages,
-                    max_file_size=pdf_max_file_size,
-                )
+                self.pdf_processor = _create_pdf_processor(pdf_timeout, pdf_max_pages, pdf_max_file_size)
                 logger.info("Secure PDF extraction enabled with safety protections")
             except ImportError:
                 logger.warning("PyPDF2 not available - PDF extraction disabled")
@@ -74,6 +275,29 @@ class SecureTextExtractor:
         else:
             self.pdf_processor = None
 
+        # extension -> handler, so routing a file is a single dict lookup
+        self._dispatch: dict[str, Callable[[ExtractionResult, Path, int | None, int], None]] = {
+            ".pdf": self._handle_pdf,
+            **dict.fromkeys(_PLAIN_TEXT_EXTS, self._handle_plain_text),
+        }
+
+        # SafePDFProcessor keeps per-call timeout state, so worker threads of
+        # extract_text_batch get their own processor instances
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+
+        # (resolved path, mtime_ns, size) -> sha256, and
+        # (sha256, extension, max_size) -> successful extraction result
+        self.result_cache_size = result_cache_size
+        self._hash_index: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._result_cache: OrderedDict[tuple[str, str, int | None], ExtractionResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Warm PDF worker processes, created on first use
+        self.pdf_worker_processes = pdf_worker_processes
+        self._pdf_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._pdf_pool_lock = threading.Lock()
+
         logger.info(
             "SecureTextExtractor initialized (PDF: %s)",
             "enabled" if self.enable_pdf_extraction else "disabled",
@@ -86,10 +310,9 @@ class SecureTextExtractor:
         Returns:
             List of supported file extensions including dot prefix
         """
-        extensions = list(self.supported_extensions.keys())
-        if not self.enable_pdf_extraction:
-            extensions = [ext for ext in extensions if ext != ".pdf"]
-        return extensions
+        if self.enable_pdf_extraction:
+            return list(self._extensions_with_pdf)
+        return list(self._extensions_without_pdf)
 
     def can_extract(self, file_path: str | Path) -> bool:
         """
@@ -101,15 +324,157 @@ class SecureTextExtractor:
         Returns:
             True if extraction is supported
         """
-        path = Path(file_path)
-        extension = path.suffix.lower()
+        extension = _suffix_lower(file_path)
 
         if extension == ".pdf":
             return self.enable_pdf_extraction
 
         return extension in self.supported_extensions
 
-    def extract_text(self, file_path: str | Path, max_size: int | None = None) -> dict[str, Any]:
+    def _get_pdf_processor(self) -> "SafePDFProcessor | None":
+        """Return the PDF processor owned by the calling thread."""
+        if self.pdf_processor is None or threading.get_ident() == self._owner_thread:
+            return self.pdf_processor
+
+        processor = getattr(self._local, "pdf_processor", None)
+        if processor is None:
+            processor = _create_pdf_processor(self.pdf_timeout, self.pdf_max_pages, self.pdf_max_file_size)
+            self._local.pdf_processor = processor
+        return processor
+
+    def _extract_pdf(self, file_path: str | Path) -> dict[str, Any]:
+        """Extract a PDF in-process or, when configured, in the worker pool.
+
+        SafePDFProcessor's timeout is cooperative and cannot interrupt a
+        parser stuck inside a single page; pool workers enforce a hard,
+        per-job limit themselves (see _extract_pdf_in_worker), so a timeout
+        fails only that PDF and leaves the pool and other jobs running.
+        """
+        if self.pdf_worker_processes <= 0:
+            return self._get_pdf_processor().extract_text(file_path)
+
+        with self._pdf_pool_lock:
+            if self._pdf_pool is None:
+                self._pdf_pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.pdf_worker_processes)
+            pool = self._pdf_pool
+
+        future = pool.submit(
+            _extract_pdf_in_worker, str(file_path), self.pdf_timeout, self.pdf_max_pages, self.pdf_max_file_size
+        )
+        try:
+            return future.result()
+        except _PDFWorkerTimeout:
+            # Only reachable if the alarm fired outside the worker's handler;
+            # it is a BaseException, so _extract_text would not catch it
+            return _pdf_timeout_result(self.pdf_timeout)
+
+    def close(self) -> None:
+        """Shut down the PDF worker pool, if one was started."""
+        with self._pdf_pool_lock:
+            pool, self._pdf_pool = self._pdf_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _is_cacheable(self, extension: str, file_size: int, max_size: int | None) -> bool:
+        """Return whether a result for this file may be cached, and so worth hashing.
+
+        Hashing reads the whole file, so it is skipped whenever extraction
+        itself would read less of it: plain text above its size limit is
+        truncated, text above ``stream_threshold`` is streamed (and streamed
+        results are never cached), and oversized PDFs are rejected.
+        """
+        if extension == ".pdf":
+            return file_size <= self.pdf_max_file_size
+        if extension not in self.supported_extensions:
+            return False
+        if self.stream_threshold is not None and file_size > self.stream_threshold:
+            return False
+        return file_size <= (max_size or _DEFAULT_TEXT_SIZE_LIMIT)
+
+    def _content_digest(self, path: Path, extension: str, stat_result: os.stat_result) -> str | None:
+        """Return the content hash of ``path``, reusing it while the file is unchanged.
+
+        Returns None when caching is disabled or the path would be rejected
+        by extraction, so that the normal path reports the error.
+        """
+        if self.result_cache_size <= 0:
+            return None
+        try:
+            if extension != ".pdf":
+                SecureTextExtractor._validate_file_path(path)
+            index_key = (str(path.resolve()), stat_result.st_mtime_ns, stat_result.st_size)
+        except (OSError, ValueError):
+            return None
+
+        # An unchanged (mtime, size) skips hashing the file again
+        with self._cache_lock:
+            digest = self._hash_index.get(index_key)
+            if digest is not None:
+                self._hash_index.move_to_end(index_key)
+                return digest
+
+        try:
+            digest = _content_hash(path)
+        except OSError:
+            return None
+
+        with self._cache_lock:
+            self._hash_index[index_key] = digest
+            while len(self._hash_index) > self.result_cache_size:
+                self._hash_index.popitem(last=False)
+        return digest
+
+    def _get_cached_result(self, cache_key: tuple[str, str, int | None]) -> ExtractionResult | None:
+        """Return a copy of a cached extraction result, if present."""
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+        return replace(cached, warnings=list(cached.warnings))
+
+    def _store_cached_result(self, cache_key: tuple[str, str, int | None], result: ExtractionResult) -> None:
+        """Cache a copy of a successful extraction result."""
+        with self._cache_lock:
+            self._result_cache[cache_key] = replace(result, warnings=list(result.warnings))
+            while len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached content hashes and extraction results."""
+        with self._cache_lock:
+            self._hash_index.clear()
+            self._result_cache.clear()
+
+    def extract_text_batch(
+        self,
+        file_paths: Iterable[str | Path],
+        max_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> list[ExtractionResult]:
+        """
+        Extract text from many files concurrently.
+
+        Extraction is I/O bound (stat, read, PDF parsing), so files are fanned
+        out over a thread pool.
+
+        Args:
+            file_paths: Paths of files to extract
+            max_size: Optional maximum file size limit applied to every file
+            max_workers: Worker thread count (default: min(32, 4 * CPU count))
+
+        Returns:
+            One extract_text result per path, in input order
+        """
+        paths = list(file_paths)
+        workers = min(max_workers or min(32, (os.cpu_count() or 1) * 4), len(paths))
+        if workers <= 1:
+            return [self.extract_text(path, max_size) for path in paths]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda path: self.extract_text(path, max_size), paths))
+
+    def extract_text(self, file_path: str | Path, max_size: int | None = None) -> ExtractionResult:
         """
         Extract text from file with appropriate security measures.
 
@@ -118,84 +483,120 @@ class SecureTextExtractor:
             max_size: Optional maximum file size limit
 
         Returns:
-            Dictionary containing extraction results with keys:
-                - success: bool
-                - text: str (extracted text)
-                - file_type: str
-                - processing_time: float
-                - warnings: List[str]
-                - error: str (if failed)
+            ExtractionResult; ``error`` is set when extraction failed, and
+            ``text_iter`` replaces ``text`` for plain text files above
+            ``stream_threshold``. Use ``to_dict()`` for the dictionary form.
+            ``processing_time`` is only measured when ``collect_timing`` is set.
         """
-        start_time = time.time()
-        path = Path(file_path)
-        extension = path.suffix.lower()
+        if not self.collect_timing:
+            return self._extract_text(file_path, max_size)
 
-        result = {
-            "success": False,
-            "text": "",
-            "file_type": self.supported_extensions.get(extension, "unknown"),
-            "processing_time": 0,
-            "warnings": [],
-            "error": None,
-        }
+        start_ns = time.perf_counter_ns()
+        result = self._extract_text(file_path, max_size)
+        result.processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        return result
+
+    def _extract_text(self, file_path: str | Path, max_size: int | None) -> ExtractionResult:
+        """Extract text from one file without timing it."""
+        path = _as_path(file_path)
+        extension = _suffix_lower(path)
+
+        result = ExtractionResult(file_type=self.supported_extensions.get(extension, "unknown"))
 
         try:
-            if not path.exists():
-                result["error"] = f"File does not exist: {file_path}"
+            # One stat() answers exists, is_file and size
+            try:
+                stat_result = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                result.error = f"File does not exist: {file_path}"
                 return result
 
-            if not path.is_file():
-                result["error"] = f"Path is not a file: {file_path}"
+            if not stat.S_ISREG(stat_result.st_mode):
+                result.error = f"Path is not a file: {file_path}"
                 return result
 
             # Check file size if specified
-            file_size = path.stat().st_size
+            file_size = stat_result.st_size
             if max_size and file_size > max_size:
-                result["error"] = f"File too large: {file_size} bytes (max: {max_size})"
+                result.error = f"File too large: {file_size} bytes (max: {max_size})"
                 return result
 
-            # Route to appropriate extractor based on file type
-            if extension == ".pdf":
-                if not self.enable_pdf_extraction:
-                    result["error"] = "PDF extraction is disabled"
+            # Unchanged content was already extracted: reuse that result
+            if self._is_cacheable(extension, file_size, max_size):
+                digest = self._content_digest(path, extension, stat_result)
+            else:
+                digest = None
+            cache_key = (digest, extension, max_size) if digest is not None else None
+            if cache_key is not None:
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    result = cached
                     return result
 
-                pdf_result = self.pdf_processor.extract_text(file_path)
-
-                # Map PDF result to our standard format
-                result["success"] = pdf_result["success"]
-                result["text"] = pdf_result["text"]
-                result["warnings"] = pdf_result["warnings"]
-                result["error"] = pdf_result["error"]
-
-                # Add PDF-specific metadata
-                result["pages_processed"] = pdf_result.get("pages_processed", 0)
-                result["total_pages"] = pdf_result.get("total_pages", 0)
-
-            elif extension in [".txt", ".md", ".py", ".js", ".html", ".json", ".csv"]:
-                # Handle plain text files
-                text_result = SecureTextExtractor._extract_plain_text(path, max_size)
-                result.update(text_result)
+            # Route to appropriate extractor based on file type
+            handler = self._dispatch.get(extension)
+            if handler is None:
+                result.error = f"Unsupported file type: {extension}"
             else:
-                result["error"] = f"Unsupported file type: {extension}"
+                handler(result, path, max_size, file_size)
+
+            # A streamed result can only be consumed once
+            if cache_key is not None and result.success and result.text_iter is None:
+                self._store_cached_result(cache_key, result)
 
         except Exception as e:
-            result["error"] = f"Unexpected error during extraction: {str(e)}"
+            result.error = f"Unexpected error during extraction: {str(e)}"
             logger.error("Error extracting text from %s: %s", file_path, str(e))
 
-        finally:
-            result["processing_time"] = time.time() - start_time
-
         return result
 
+    def _handle_pdf(self, result: ExtractionResult, path: Path, max_size: int | None, file_size: int) -> None:
+        """Fill ``result`` from the PDF extractor."""
+        if not self.enable_pdf_extraction:
+            result.error = "PDF extraction is disabled"
+            return
+
+        pdf_result = self._extract_pdf(path)
+
+        # Map PDF result to our standard format
+        result.success = pdf_result["success"]
+        result.text = pdf_result["text"]
+        result.warnings = pdf_result["warnings"]
+        result.error = pdf_result["error"]
+
+        # Add PDF-specific metadata
+        result.pages_processed = pdf_result.get("pages_processed", 0)
+        result.total_pages = pdf_result.get("total_pages", 0)
+
+    def _handle_plain_text(self, result: ExtractionResult, path: Path, max_size: int | None, file_size: int) -> None:
+        """Fill ``result`` from the plain text reader."""
+        text_result = SecureTextExtractor._extract_plain_text(
+            path, max_size, self.stream_threshold, file_size, collapse_html_whitespace=self.collapse_html_whitespace
+        )
+        result.success = text_result["success"]
+        result.text = text_result["text"]
+        result.warnings = text_result["warnings"]
+        result.error = text_result.get("error")
+        result.text_iter = text_result.get("text_iter")
+
     @staticmethod
-    def _extract_plain_text(file_path: Path, max_size: int | None = None) -> dict[str, Any]:
+    def _extract_plain_text(
+        file_path: Path,
+        max_size: int | None = None,
+        stream_threshold: int | None = None,
+        file_size: int | None = None,
+        *,
+        collapse_html_whitespace: bool = False,
+    ) -> dict[str, Any]:
         """
         Extract text from plain text files with size limits.
 
         Args:
             file_path: Path to text file
             max_size: Maximum file size to process
+            stream_threshold: Stream files larger than this many bytes
+            file_size: Size already known from the caller's stat (None stats the file)
+            collapse_html_whitespace: Also collapse runs of spaces and tabs in .html text
 
         Returns:
             Extraction result dictionary
@@ -203,16 +604,24 @@ class SecureTextExtractor:
         result = {"success": False, "text": "", "warnings": []}
 
         try:
-            file_size = file_path.stat().st_size
-            size_limit = max_size or (10 * 1024 * 1024)
-
-            SecureTextExtractor._read_text_with_size_limit(file_path, file_size, size_limit, result)
+            if file_size is None:
+                file_size = file_path.stat().st_size
+            size_limit = max_size or _DEFAULT_TEXT_SIZE_LIMIT
+
+            if stream_threshold is not None and file_size > stream_threshold:
+                SecureTextExtractor._validate_file_path(file_path)
+                result["text_iter"] = SecureTextExtractor._stream_text(file_path, size_limit)
+                if file_size > size_limit:
+                    result["warnings"].append(f"File size ({file_size} bytes) exceeds limit ({size_limit} bytes)")
+                    result["warnings"].append("File content truncated due to size limit")
+            else:
+                SecureTextExtractor._read_text_with_size_limit(file_path, file_size, size_limit, result)
+                # Clean once here so the cached and chunked text is already lean
+                if _suffix_lower(file_path) == ".html":
+                    result["text"] = _clean_html(result["text"], collapse_whitespace=collapse_html_whitespace)
 
             result["success"] = True
 
-        except UnicodeDecodeError:
-            SecureTextExtractor._handle_encoding_fallback(file_path, result)
-
         except Exception as e:
             result["error"] = f"Error reading text file: {str(e)}"
 
@@ -220,7 +629,6 @@ class SecureTextExtractor:
 
     # Path validation constants
     _PATH_TRAVERSAL_ERROR = "Path traversal detected: file is outside working directory"
-    _INVALID_PATH_ERROR = "Invalid file path: contains path traversal patterns"
 
     @staticmethod
     def _validate_file_path(file_path: Path) -> None:
@@ -234,10 +642,10 @@ class SecureTextExtractor:
         """
         try:
             resolved_path = file_path.resolve()
-            cwd = Path.cwd().resolve()
+            cwd = SecureTextExtractor._resolve_cwd(os.getcwd())
 
+            # Containment of the resolved path also rules out "../" escapes
             SecureTextExtractor._check_path_relative_to_cwd(resolved_path, cwd)
-            SecureTextExtractor._check_traversal_patterns(file_path, resolved_path, cwd)
 
         except Exception as e:
             if isinstance(e, ValueError):
@@ -245,27 +653,14 @@ class SecureTextExtractor:
             raise ValueError(f"Path validation failed: {str(e)}")
 
     @staticmethod
-    def _check_path_relative_to_cwd(resolved_path: Path, cwd: Path) -> None:
-        """Check if resolved path is relative to current working directory.
-
-        Args:
-            resolved_path: Resolved absolute path
-            cwd: Current working directory
-
-        Raises:
-            ValueError: If path is outside working directory
-        """
-        if hasattr(resolved_path, "is_relative_to"):
-            # Python 3.9+
-            if not resolved_path.is_relative_to(cwd):
-                raise ValueError(SecureTextExtractor._PATH_TRAVERSAL_ERROR)
-        else:
-            # Fallback for Python < 3.9
-            SecureTextExtractor._check_path_manually(resolved_path, cwd)
+    @lru_cache(maxsize=16)
+    def _resolve_cwd(cwd_str: str) -> Path:
+        """Resolve the working directory once per distinct ``os.getcwd()`` value."""
+        return Path(cwd_str).resolve()
 
     @staticmethod
-    def _check_path_manually(resolved_path: Path, cwd: Path) -> None:
-        """Manually check if path is relative to working directory (Python < 3.9).
+    def _check_path_relative_to_cwd(resolved_path: Path, cwd: Path) -> None:
+        """Check if resolved path is relative to current working directory.
 
         Args:
             resolved_path: Resolved absolute path
@@ -274,34 +669,8 @@ class SecureTextExtractor:
         Raises:
             ValueError: If path is outside working directory
         """
-        try:
-            resolved_path.relative_to(cwd)
-        except ValueError as e:
-            if "does not start with" in str(e):
-                raise ValueError(SecureTextExtractor._PATH_TRAVERSAL_ERROR) from e
-            # Check using path parts comparison
-            cwd_parts = cwd.parts
-            resolved_parts = resolved_path.parts
-            if resolved_parts[: len(cwd_parts)] != cwd_parts:
-                raise ValueError(SecureTextExtractor._PATH_TRAVERSAL_ERROR) from e
-
-    @staticmethod
-    def _check_traversal_patterns(file_path: Path, resolved_path: Path, cwd: Path) -> None:
-        """Check for path traversal patterns in the path string.
-
-        Args:
-            file_path: Original file path
-            resolved_path: Resolved absolute path
-            cwd: Current working directory
-
-        Raises:
-            ValueError: If path contains traversal patterns and resolves outside cwd
-        """
-        path_str = str(file_path)
-        if "../" in path_str or "..\\" in path_str:
-            # Only raise if the resolved path confirms it's actually traversing
-            if not str(resolved_path).startswith(str(cwd)):
-                raise ValueError(SecureTextExtractor._INVALID_PATH_ERROR)
+        if not resolved_path.is_relative_to(cwd):
+            raise ValueError(SecureTextExtractor._PATH_TRAVERSAL_ERROR)
 
     @staticmethod
     def _read_text_with_size_limit(file_path: Path, file_size: int, size_limit: int, result: dict[str, Any]) -> None:
@@ -319,41 +688,99 @@ class SecureTextExtractor:
         if file_size > size_limit:
             result["warnings"].append(f"File size ({file_size} bytes) exceeds limit ({size_limit} bytes)")
             # Read only up to the limit
-            with open(file_path, encoding="utf-8", errors="replace") as f:
-                result["text"] = f.read(size_limit)
+            result["text"], encoding = SecureTextExtractor._read_text(file_path, file_size, size_limit)
             result["warnings"].append("File content truncated due to size limit")
         else:
             # Read entire file
-            with open(file_path, encoding="utf-8", errors="replace") as f:
-                result["text"] = f.read()
+            result["text"], encoding = SecureTextExtractor._read_text(file_path, file_size, None)
+
+        if encoding != "utf-8":
+            result["warnings"].append(f"Decoded using {encoding} encoding")
 
     @staticmethod
-    def _handle_encoding_fallback(file_path: Path, result: dict[str, Any]) -> None:
-        """Try alternative encodings when UTF-8 fails.
+    def _read_text(file_path: Path, file_size: int, size_limit: int | None) -> tuple[str, str]:
+        """Read and decode up to ``size_limit`` bytes of a text file.
 
         Args:
             file_path: Path to text file
-            result: Result dictionary to update
+            file_size: Size of the file
+            size_limit: Maximum number of bytes to decode (None reads it all)
+
+        Returns:
+            Tuple of (decoded text, encoding used)
         """
-        # Validate path before opening file
-        try:
-            SecureTextExtractor._validate_file_path(file_path)
-        except ValueError as e:
-            result["error"] = str(e)
-            return
+        truncated = size_limit is not None and file_size > size_limit
+        with open(file_path, "rb", buffering=_TEXT_READ_BUFFER) as f:
+            if file_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm)[:size_limit] as view:
+                    return SecureTextExtractor._decode_text(view, truncated)
+            return SecureTextExtractor._decode_text(f.read(size_limit), truncated)
 
-        for encoding in ["latin-1", "cp1252", "iso-8859-1"]:
-            try:
-                with open(file_path, encoding=encoding, errors="replace") as f:
-                    result["text"] = f.read()
-                result["success"] = True
-                result["warnings"].append(f"Decoded using {encoding} encoding")
-                break
-            except (OSError, ValueError):
-                continue
+    @staticmethod
+    def _stream_text(file_path: Path, size_limit: int, chunk_bytes: int = _STREAM_CHUNK_BYTES) -> Iterator[str]:
+        """Lazily read and decode up to ``size_limit`` bytes of a text file.
+
+        Only one ``chunk_bytes`` window is held at a time. The encoding cannot
+        be detected without the whole file, so the text is decoded as UTF-8
+        with invalid sequences replaced; universal newlines are applied,
+        including a CRLF split across two windows.
+
+        Args:
+            file_path: Path to text file (already validated)
+            size_limit: Maximum number of bytes to decode
+            chunk_bytes: Bytes read per window
+
+        Yields:
+            Decoded text chunks
+        """
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
+        remaining = size_limit
+        with open(file_path, "rb", buffering=0) as f:
+            while remaining > 0 and (block := f.read(min(chunk_bytes, remaining))):
+                remaining -= len(block)
+                if text := decoder.decode(block):
+                    yield text
+            # A multi-byte character split by the size limit is dropped
+            # rather than replaced
+            truncated = remaining == 0 and f.read(1)
+            if not truncated and (text := decoder.decode(b"", final=True)):
+                yield text
+
+    @staticmethod
+    def _decode_text(raw: bytes | memoryview, truncated: bool = False) -> tuple[str, str]:
+        """Decode file bytes the way text-mode ``open`` would.
 
-        if not result["success"]:
-            result["error"] = "Could not decode file with any supported encoding"
+        UTF-8 is tried first. Bytes that are not valid UTF-8 are handed to
+        charset-normalizer when it is installed; otherwise, or when it finds
+        no match, invalid sequences are replaced as before.
+
+        Args:
+            raw: Bytes read (or mapped) from the file
+            truncated: Whether ``raw`` was cut at the size limit; a multi-byte
+                character split by the cut is dropped rather than replaced
+
+        Returns:
+            Tuple of (decoded text with universal newlines applied, encoding)
+        """
+
+        def decode_utf8(errors: str) -> str:
+            if truncated:
+                return codecs.getincrementaldecoder("utf-8")(errors=errors).decode(raw, final=False)
+            return str(raw, "utf-8", errors)
+
+        encoding = "utf-8"
+        try:
+            text = decode_utf8("strict")
+        except UnicodeDecodeError:
+            # Detect from the bytes already in memory rather than re-reading
+            best = charset_normalizer.from_bytes(bytes(raw)).best() if CHARSET_NORMALIZER_AVAILABLE else None
+            if best is not None:
+                text, encoding = str(best), best.encoding
+            else:
+                text = decode_utf8("replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text, encoding
 
     def is_file_safe(self, file_path: str | Path) -> dict[str, Any]:
         """
@@ -365,8 +792,8 @@ class SecureTextExtractor:
         Returns:
             Safety assessment dictionary
         """
-        path = Path(file_path)
-        extension = path.suffix.lower()
+        path = _as_path(file_path)
+        extension = _suffix_lower(path)
 
         result = {
             "safe": False,
@@ -377,19 +804,21 @@ class SecureTextExtractor:
         }
 
         try:
-            # Basic file checks
-            if not path.exists():
+            # Basic file checks, answered by a single stat()
+            try:
+                stat_result = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 result["checks_failed"].append("File does not exist")
                 return result
 
-            if not path.is_file():
+            if not stat.S_ISREG(stat_result.st_mode):
                 result["checks_failed"].append("Path is not a file")
                 return result
 
             result["checks_passed"].append("File exists and is accessible")
 
             # File size check
-            file_size = path.stat().st_size
+            file_size = stat_result.st_size
             if file_size > 100 * 1024 * 1024:  # 100MB
                 result["warnings"].append(f"Large file: {file_size} bytes")
             else:
@@ -397,14 +826,20 @@ class SecureTextExtractor:
 
             # Type-specific safety checks
             if extension == ".pdf" and self.enable_pdf_extraction:
+                # Reject files without the PDF magic bytes before parsing
+                with open(path, "rb") as f:
+                    if not f.read(_PDF_SNIFF_BYTES).startswith(_PDF_MAGIC):
+                        result["checks_failed"].append("File does not have valid PDF header")
+                        return result
+
                 # Use PDF processor's safety check
-                pdf_safety = self.pdf_processor.is_pdf_safe(file_path)
+                pdf_safety = self._get_pdf_processor().is_pdf_safe(file_path)
                 result["safe"] = pdf_safety["safe"]
                 result["checks_passed"].extend(pdf_safety["checks_passed"])
                 result["checks_failed"].extend(pdf_safety["checks_failed"])
                 result["warnings"].extend(pdf_safety["warnings"])
 
-            elif extension in [".txt", ".md", ".py", ".js", ".html", ".json", ".csv"]:
+            elif extension in _PLAIN_TEXT_EXTS:
                 # Text files are generally safe
                 result["checks_passed"].append("Plain text format")
                 result["safe"] = True
@@ -421,6 +856,27 @@ class SecureTextExtractor:
 
         return result
 
+    def is_files_safe(
+        self, file_paths: Iterable[str | Path], max_workers: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Check many files for extraction safety concurrently.
+
+        Args:
+            file_paths: Paths of files to check
+            max_workers: Worker thread count (default: min(32, 4 * CPU count))
+
+        Returns:
+            One is_file_safe assessment per path, in input order
+        """
+        paths = list(file_paths)
+        workers = min(max_workers or min(32, (os.cpu_count() or 1) * 4), len(paths))
+        if workers <= 1:
+            return [self.is_file_safe(path) for path in paths]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.is_file_safe, paths))
+
     def get_extraction_stats(self) -> dict[str, Any]:
         """
         Get statistics about extraction capabilities and limits.
@@ -482,7 +938,7 @@ def extract_text_secure(file_path: str | Path, pdf_timeout: int = 30, max_size:
     extractor = SecureTextExtractor(pdf_timeout=pdf_timeout)
     result = extractor.extract_text(file_path, max_size=max_size)
 
-    if result["success"]:
-        return result["text"]
-    logger.error("Failed to extract text from %s: %s", file_path, result["error"])
+    if result.success:
+        return result.text
+    logger.error("Failed to extract text from %s: %s", file_path, result.error)
     return ""
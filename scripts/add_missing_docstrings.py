@@ -17,15 +17,23 @@ Options:
     --fix-all        Process all Python files in the project
     --interactive    Ask for confirmation before each change
     --templates DIR  Use custom template directory
+    --jobs N         Number of worker processes (default: CPU count)
 """
 
 import argparse
 import ast
 import glob
+import io
 import os
 import re
+import shutil
 import sys
+import textwrap
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +54,9 @@ class FunctionInfo:
     is_staticmethod: bool
     decorators: list[str]
     parent_class: str | None = None
+    has_docstring: bool = False
+    body_lineno: int = 0
+    body_col_offset: int = 0
 
 
 @dataclass
@@ -59,6 +70,9 @@ class ClassInfo:
     decorators: list[str]
     methods: list[FunctionInfo]
     properties: list[str]
+    has_docstring: bool = False
+    body_lineno: int = 0
+    body_col_offset: int = 0
 
 
 @dataclass
@@ -72,13 +86,196 @@ class ModuleInfo:
     has_module_docstring: bool
 
 
+_CAMEL_RE = re.compile(r"([A-Z])")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def _humanize_name(name: str) -> str:
+    """Convert snake_case or CamelCase to human readable form."""
+    name = _CAMEL_RE.sub(r" \1", name).strip()
+    name = name.replace("_", " ")
+    if "  " in name:
+        # Identifiers hold no whitespace of their own, so only doubled spaces need collapsing
+        name = _WS_RE.sub(" ", name)
+    return name.lower()
+
+
+# Trailing CamelCase word of a class name, e.g. "Manager" in "CacheManager".
+_LAST_WORD_RE = re.compile(r"[A-Z][a-z]*$")
+
+# Receivers left out of generated Args sections
+_IMPLICIT_ARGS = frozenset({"self", "cls"})
+
+# Dispatch table for the top-level statements DocstringAnalyzer cares about.
+_KIND_CLASS = "class"
+_KIND_FUNCTION = "function"
+_KIND_IMPORT = "import"
+_TOP_LEVEL_KINDS: dict[type[ast.AST], str] = {
+    ast.ClassDef: _KIND_CLASS,
+    ast.FunctionDef: _KIND_FUNCTION,
+    ast.AsyncFunctionDef: _KIND_FUNCTION,
+    ast.Import: _KIND_IMPORT,
+    ast.ImportFrom: _KIND_IMPORT,
+}
+
+
+# Module-level statements whose blocks can still hold definitions and imports,
+# e.g. ``if TYPE_CHECKING:`` or ``try: import x`` fallbacks.
+_BLOCK_STATEMENTS = (ast.If, ast.Try, ast.TryStar, ast.With, ast.AsyncWith, ast.For, ast.AsyncFor, ast.While)
+
+
+def _iter_module_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Yield module-level statements in source order, entering block statements."""
+    for node in body:
+        if isinstance(node, _BLOCK_STATEMENTS):
+            yield from _iter_module_statements(node.body)
+            for handler in getattr(node, "handlers", ()):
+                yield from _iter_module_statements(handler.body)
+            yield from _iter_module_statements(getattr(node, "orelse", ()))
+            yield from _iter_module_statements(getattr(node, "finalbody", ()))
+        else:
+            yield node
+
+
+def _body_start(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> dict[str, int]:
+    """Locate the first body statement, counting decorators, where a docstring goes."""
+    first = node.body[0]
+    decorators = getattr(first, "decorator_list", ())
+    lineno = min([first.lineno, *(d.lineno for d in decorators)])
+    return {"body_lineno": lineno, "body_col_offset": first.col_offset}
+
+
+# Shebang and PEP 263 encoding lines must stay ahead of a module docstring
+_ENCODING_RE = re.compile(r"^[ \t\f]*#.*?coding[:=]")
+
+
+def _module_preamble_length(lines: list[str]) -> int:
+    """Return how many leading lines (shebang, encoding) precede a module docstring."""
+    count = 0
+    for line in lines[:2]:
+        if (count == 0 and line.startswith("#!")) or _ENCODING_RE.match(line):
+            count += 1
+        else:
+            break
+    return count
+
+
+def _format_alias(alias: ast.alias) -> str:
+    """Render one ``name [as asname]`` clause of an import."""
+    return alias.name if alias.asname is None else f"{alias.name} as {alias.asname}"
+
+
+def _format_import(node: ast.Import | ast.ImportFrom) -> str:
+    """Render an import statement without going through ast.unparse."""
+    names = ", ".join(_format_alias(alias) for alias in node.names)
+    if isinstance(node, ast.Import):
+        return f"import {names}"
+    return f"from {'.' * node.level}{node.module or ''} import {names}"
+
+
+def _expr_source(node: ast.expr) -> str:
+    """Render a base, decorator or annotation; dotted names skip ast.unparse."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parts = [node.attr]
+        value = node.value
+        while isinstance(value, ast.Attribute):
+            parts.append(value.attr)
+            value = value.value
+        if isinstance(value, ast.Name):
+            parts.append(value.id)
+            return ".".join(reversed(parts))
+    return ast.unparse(node)
+
+
 class DocstringGenerator:
     """Generates appropriate docstring templates based on code analysis."""
 
-    def __init__(self, templates_dir: Path | None = None):
-        """Initialize the docstring generator."""
-        self.templates_dir = templates_dir
-        self.common_exceptions = {
+    _VERB_PREFIXES = {
+        "get": "Get {}.",
+        "set": "Set {}.",
+        "create": "Create {}.",
+        "build": "Build {}.",
+        "validate": "Validate {}.",
+        "process": "Process {}.",
+        "handle": "Handle {}.",
+        "parse": "Parse {}.",
+        "load": "Load {}.",
+        "save": "Save {}.",
+        "update": "Update {}.",
+        "delete": "Delete {}.",
+        "remove": "Delete {}.",
+        "is": "Check if {}.",
+        "has": "Check if {}.",
+        "can": "Check if can {}.",
+    }
+    _MAGIC_SUMMARIES = {
+        "__str__": "Return string representation.",
+        "__repr__": "Return detailed string representation.",
+        "__call__": "Make instance callable.",
+    }
+    _CLASS_SUFFIXES = {
+        "Manager": "Manages {} operations.",
+        "Handler": "Handles {} events.",
+        "Controller": "Controls {} behavior.",
+        "Service": "Provides {} services.",
+        "Factory": "Creates {} instances.",
+        "Builder": "Builds {} objects.",
+        "Parser": "Parses {} data.",
+        "Validator": "Validates {} input.",
+        "Exception": "Exception for {} errors.",
+        "Error": "Exception for {} errors.",
+        "Config": "Configuration for {}.",
+        "Configuration": "Configuration for {}.",
+        "Proto": "Protocol defining {} interface.",
+        "Protocol": "Protocol defining {} interface.",
+    }
+    _ARG_DESCRIPTIONS = {
+        "data": "The data to process",
+        "content": "The data to process",
+        "filename": "Path to the file",
+        "filepath": "Path to the file",
+        "path": "Path to the file",
+        "config": "Configuration parameters",
+        "configuration": "Configuration parameters",
+        "timeout": "Timeout in seconds",
+        "delay": "Timeout in seconds",
+        "max_size": "Maximum size or limit",
+        "limit": "Maximum size or limit",
+        "max_length": "Maximum size or limit",
+        "callback": "Callback function to execute",
+        "handler": "Callback function to execute",
+        "id": "Unique identifier",
+        "name": "Name of the item",
+        "value": "Value to process",
+        "val": "Value to process",
+    }
+    _RETURN_DESCRIPTIONS = {
+        "bool": "True if successful, False otherwise",
+        "Boolean": "True if successful, False otherwise",
+        "str": "Processed string result",
+        "string": "Processed string result",
+        "String": "Processed string result",
+        "int": "Numeric result",
+        "Integer": "Numeric result",
+        "list": "List of results",
+        "List": "List of results",
+        "dict": "Dictionary containing results",
+        "Dict": "Dictionary containing results",
+    }
+    _EXCEPTION_DESCRIPTIONS = {
+        "ValueError": "If input values are invalid",
+        "TypeError": "If arguments are of wrong type",
+        "KeyError": "If required key is missing",
+        "FileNotFoundError": "If file cannot be found",
+        "ConnectionError": "If connection fails",
+        "TimeoutError": "If operation times out",
+    }
+
+    common_exceptions = frozenset(
+        {
             "ValueError",
             "TypeError",
             "KeyError",
@@ -87,35 +284,44 @@ class DocstringGenerator:
             "ConnectionError",
             "TimeoutError",
         }
+    )
+
+    def __init__(self, templates_dir: Path | None = None):
+        """Initialize the docstring generator."""
+        self.templates_dir = templates_dir
 
     def generate_function_docstring(self, func_info: FunctionInfo) -> str:
         """Generate a docstring for a function or method."""
-        lines = []
         # Generate summary based on function name and context
         summary = self._generate_function_summary(func_info)
-        lines.append(f'    """{summary}')
+        documented_args = [arg for arg in func_info.args if arg not in _IMPLICIT_ARGS]
+        has_return = bool(func_info.return_type) and func_info.return_type != "None"
+        potential_exceptions = self._detect_potential_exceptions(func_info)
+        if not documented_args and not has_return and not potential_exceptions:
+            # Summary-only docstrings fit on one line
+            return f'    """{summary}"""'
+        lines = [f'    """{summary}']
         # Add parameter documentation if function has parameters
-        if func_info.args and not (len(func_info.args) == 1 and func_info.args[0] in ("self", "cls")):
+        if documented_args:
             lines.append("")
             lines.append("    Args:")
-            for arg in func_info.args:
-                if arg not in ("self", "cls"):
-                    arg_desc = self._generate_arg_description(arg, func_info.name)
-                    lines.append(f"        {arg}: {arg_desc}")
+            lines.extend(
+                f"        {arg}: {self._generate_arg_description(arg, func_info.name)}" for arg in documented_args
+            )
         # Add return documentation if function has return type annotation
-        if func_info.return_type and func_info.return_type != "None":
+        if has_return:
             lines.append("")
             lines.append("    Returns:")
             return_desc = self._generate_return_description(func_info.return_type, func_info.name)
             lines.append(f"        {return_desc}")
         # Add raises section for common exception patterns
-        potential_exceptions = self._detect_potential_exceptions(func_info)
         if potential_exceptions:
             lines.append("")
             lines.append("    Raises:")
-            for exc in potential_exceptions:
-                exc_desc = self._generate_exception_description(exc, func_info.name)
-                lines.append(f"        {exc}: {exc_desc}")
+            lines.extend(
+                f"        {exc}: {self._generate_exception_description(exc, func_info.name)}"
+                for exc in potential_exceptions
+            )
         lines.append('    """')
         return "\n".join(lines)
 
@@ -167,154 +373,74 @@ class DocstringGenerator:
     def _generate_function_summary(self, func_info: FunctionInfo) -> str:
         """Generate a summary line for a function."""
         name = func_info.name
-        # Common patterns for function names
-        if name.startswith("get_"):
-            return f"Get {self._humanize_name(name[4:])}."
-        if name.startswith("set_"):
-            return f"Set {self._humanize_name(name[4:])}."
-        if name.startswith("create_"):
-            return f"Create {self._humanize_name(name[7:])}."
-        if name.startswith("build_"):
-            return f"Build {self._humanize_name(name[6:])}."
-        if name.startswith("init_") or name == "__init__":
-            return f"Initialize {self._humanize_name(func_info.parent_class or 'instance')}."
-        if name.startswith("validate_"):
-            return f"Validate {self._humanize_name(name[9:])}."
-        if name.startswith("process_"):
-            return f"Process {self._humanize_name(name[8:])}."
-        if name.startswith("handle_"):
-            return f"Handle {self._humanize_name(name[7:])}."
-        if name.startswith("parse_"):
-            return f"Parse {self._humanize_name(name[6:])}."
-        if name.startswith("load_"):
-            return f"Load {self._humanize_name(name[5:])}."
-        if name.startswith("save_"):
-            return f"Save {self - _humanize_name(name[5:])}."
-        if name.startswith("update_"):
-            return f"Update {self._humanize_name(name[7:])}."
-        if name.startswith("delete_") or name.startswith("remove_"):
-            prefix_len = 7 if name.startswith("delete_") else 7
-            return f"Delete {self._humanize_name(name[prefix_len:])}."
-        if name.startswith("is_") or name.startswith("has_"):
-            prefix_len = 3 if name.startswith("is_") else 4
-            return f"Check if {self._humanize_name(name[prefix_len:])}."
-        if name.startswith("can_"):
-            return f"Check if can {self._humanize_name(name[4:])}."
-        if name == "__str__":
-            return "Return string representation."
-        if name == "__repr__":
-            return "Return detailed string representation."
-        if name == "__call__":
-            return "Make instance callable."
+        if name == "__init__":
+            return f"Initialize {_humanize_name(func_info.parent_class or 'instance')}."
+        magic = self._MAGIC_SUMMARIES.get(name)
+        if magic is not None:
+            return magic
+        # Common patterns for function names, keyed on the leading "verb_"
+        head, sep, tail = name.partition("_")
+        if sep:
+            if head == "init":
+                return f"Initialize {_humanize_name(func_info.parent_class or 'instance')}."
+            template = self._VERB_PREFIXES.get(head)
+            if template is not None:
+                return template.format(_humanize_name(tail))
         if name.startswith("__") and name.endswith("__"):
             return f"Implement {name} magic method."
-        return f"{self._humanize_name(name).capitalize()}."
+        return f"{_humanize_name(name).capitalize()}."
 
     def _generate_class_summary(self, class_info: ClassInfo) -> str:
         """Generate a summary line for a class."""
         name = class_info.name
-        # Common patterns for class names
-        if name.endswith("Manager"):
-            return f"Manages {self._humanize_name(name[:-7])} operations."
-        if name.endswith("Handler"):
-            return f"Handles {self._humanize_name(name[:-7])} events."
-        if name.endswith("Controller"):
-            return f"Controls {self._humanize_name(name[:-10])} behavior."
-        if name.endswith("Service"):
-            return f"Provides {self._humanize_name(name[:-7])} services."
-        if name.endswith("Factory"):
-            return f"Creates {self._humanize_name(name[:-7])} instances."
-        if name.endswith("Builder"):
-            return f"Builds {self._humanize_name(name[:-7])} objects."
-        if name.endswith("Parser"):
-            return f"Parses {self._humanize_name(name[:-6])} data."
-        if name.endswith("Validator"):
-            return f"Validates {self._humanize_name(name[:-9])} input."
-        if name.endswith("Exception") or name.endswith("Error"):
-            return (
-                f"Exception for {self._humanize_name(name[:-9] if name.endswith('Exception') else name[:-5])} errors."
-            )
-        if name.endswith("Config") or name.endswith("Configuration"):
-            suffix_len = 6 if name.endswith("Config") else 13
-            return f"Configuration for {self._humanize_name(name[:-suffix_len])}."
-        if name.endswith("Proto") or name.endswith("Protocol"):
-            suffix_len = 5 if name.endswith("Proto") else 8
-            return f"Protocol defining {self._humanize_name(name[:-suffix_len])} interface."
-        return f"{self._humanize_name(name)} implementation."
+        # Common patterns for class names, keyed on the trailing CamelCase word
+        match = _LAST_WORD_RE.search(name)
+        if match is not None:
+            suffix = match.group()
+            template = self._CLASS_SUFFIXES.get(suffix)
+            if template is not None:
+                return template.format(_humanize_name(name[: -len(suffix)]))
+        return f"{_humanize_name(name)} implementation."
 
     def _generate_module_summary(self, module_name: str, module_info: ModuleInfo) -> str:
         """Generate a summary for a module."""
-        humanized = self._humanize_name(module_name)
+        humanized = _humanize_name(module_name)
         if len(module_info.classes) > len(module_info.functions):
             return f"{humanized.capitalize()} classes and utilities."
         if len(module_info.functions) > 0:
             return f"{humanized.capitalize()} utility functions."
         return f"{humanized.capitalize()} module."
 
-    def _humanize_name(self, name: str) -> str:
-        """Convert snake_case or CamelCase to human readable form."""
-        name = re.sub(r"([A-Z])", r" \1", name).strip()
-        name = name.replace("_", " ")
-        name = re.sub(r"\s+", " ", name)
-        return name.lower()
-
     def _generate_arg_description(self, arg_name: str, func_name: str) -> str:
         """Generate description for a function argument."""
-        if arg_name in ("data", "content"):
-            return "The data to process"
-        if arg_name in ("filename", "filepath", "path"):
-            return "Path to the file"
-        if arg_name in ("config", "configuration"):
-            return "Configuration parameters"
-        if arg_name in ("timeout", "delay"):
-            return "Timeout in seconds"
-        if arg_name in ("max_size", "limit", "max_length"):
-            return "Maximum size or limit"
-        if arg_name in ("callback", "handler"):
-            return "Callback function to execute"
-        if arg_name.endswith("_id") or arg_name == "id":
+        description = self._ARG_DESCRIPTIONS.get(arg_name)
+        if description is not None:
+            return description
+        if arg_name.endswith("_id"):
             return "Unique identifier"
-        if arg_name.endswith("_name") or arg_name == "name":
+        if arg_name.endswith("_name"):
             return "Name of the item"
-        if arg_name in ("value", "val"):
-            return "Value to process"
-        return f"{self._humanize_name(arg_name).capitalize()}"
+        return f"{_humanize_name(arg_name).capitalize()}"
 
     def _generate_return_description(self, return_type: str, func_name: str) -> str:
         """Generate description for return value."""
-        if return_type in ("bool", "Boolean"):
-            return "True if successful, False otherwise"
-        if return_type in ("str", "string", "String"):
-            return "Processed string result"
-        if return_type in ("int", "Integer"):
-            return "Numeric result"
-        if return_type in ("list", "List"):
-            return "List of results"
-        if return_type in ("dict", "Dict"):
-            return "Dictionary containing results"
+        description = self._RETURN_DESCRIPTIONS.get(return_type)
+        if description is not None:
+            return description
         if "Optional" in return_type:
             return "Result if successful, None otherwise"
         return f"{return_type} result"
 
     def _generate_exception_description(self, exc_name: str, func_name: str) -> str:
         """Generate description for potential exceptions."""
-        if exc_name == "ValueError":
-            return "If input values are invalid"
-        if exc_name == "TypeError":
-            return "If arguments are of wrong type"
-        if exc_name == "KeyError":
-            return "If required key is missing"
-        if exc_name == "FileNotFoundError":
-            return "If file cannot be found"
-        if exc_name == "ConnectionError":
-            return "If connection fails"
-        if exc_name == "TimeoutError":
-            return "If operation times out"
-        return f"If {self._humanize_name(exc_name.replace('Error', '').replace('Exception', ''))} error occurs"
+        description = self._EXCEPTION_DESCRIPTIONS.get(exc_name)
+        if description is not None:
+            return description
+        return f"If {_humanize_name(exc_name.replace('Error', '').replace('Exception', ''))} error occurs"
 
     def _generate_attribute_description(self, attr_name: str, class_name: str) -> str:
         """Generate description for class attributes."""
-        return f"{self._humanize_name(attr_name).capitalize()} attribute"
+        return f"{_humanize_name(attr_name).capitalize()} attribute"
 
     @staticmethod
     def _generate_class_example(class_info: ClassInfo) -> list[str]:
@@ -367,38 +493,73 @@ class DocstringAnalyzer:
             safe_path = base_dir / filename
             with open(safe_path, encoding="utf-8") as f:
                 content = f.read()
-            tree = ast.parse(content, filename=str(safe_path))
-            # Check for module docstring
-            has_module_docstring = (
-                len(tree.body) > 0
-                and isinstance(tree.body[0], ast.Expr)
-                and isinstance(tree.body[0].value, ast.Constant)
-                and isinstance(tree.body[0].value.value, str)
-            )
-            classes = []
-            functions = []
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_info = self._analyze_class(node)
-                    classes.append(class_info)
-                elif isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                    if not self._is_nested_function(node, tree):
-                        func_info = self._analyze_function(node)
-                        functions.append(func_info)
-                elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                    imports.append(ast.unparse(node))
-            return ModuleInfo(
-                filepath=filepath,
-                classes=classes,
-                functions=functions,
-                imports=imports,
-                has_module_docstring=has_module_docstring,
-            )
+            return self.analyze_source(content, filepath)
         except Exception as e:
             print(f"Error analyzing {filepath}: {e}")
             return ModuleInfo(filepath, [], [], [], True)
 
+    def analyze_source(self, content: str, filepath: Path, tree: ast.Module | None = None) -> ModuleInfo:
+        """Analyze already-read source, reusing ``tree`` when the caller has parsed it."""
+        if tree is None:
+            tree = ast.parse(content, filename=str(filepath))
+        # Check for module docstring
+        has_module_docstring = (
+            len(tree.body) > 0
+            and isinstance(tree.body[0], ast.Expr)
+            and isinstance(tree.body[0].value, ast.Constant)
+            and isinstance(tree.body[0].value.value, str)
+        )
+        classes = []
+        functions = []
+        imports = []
+        # Only module-level definitions are reported, so walk statements alone;
+        # function bodies and expression nodes are never visited.
+        for node in _iter_module_statements(tree.body):
+            kind = _TOP_LEVEL_KINDS.get(type(node))
+            if kind is _KIND_CLASS:
+                classes.append(self._analyze_class(node))
+            elif kind is _KIND_FUNCTION:
+                functions.append(self._analyze_function(node))
+            elif kind is _KIND_IMPORT:
+                imports.append(_format_import(node))
+        return ModuleInfo(
+            filepath=filepath,
+            classes=classes,
+            functions=functions,
+            imports=imports,
+            has_module_docstring=has_module_docstring,
+        )
+
+    @staticmethod
+    def _analyze_function(
+        func_node: ast.FunctionDef | ast.AsyncFunctionDef, parent_class: str | None = None
+    ) -> FunctionInfo:
+        """Analyze a function or method definition."""
+        arguments = func_node.args
+        args = [a.arg for a in (*arguments.posonlyargs, *arguments.args)]
+        if arguments.vararg is not None:
+            args.append(arguments.vararg.arg)
+        args.extend(a.arg for a in arguments.kwonlyargs)
+        if arguments.kwarg is not None:
+            args.append(arguments.kwarg.arg)
+        decorators = [_expr_source(d) for d in func_node.decorator_list]
+        return FunctionInfo(
+            name=func_node.name,
+            lineno=func_node.lineno,
+            col_offset=func_node.col_offset,
+            args=args,
+            return_type=sys.intern(_expr_source(func_node.returns)) if func_node.returns is not None else None,
+            is_async=isinstance(func_node, ast.AsyncFunctionDef),
+            is_method=parent_class is not None,
+            is_property="property" in decorators,
+            is_classmethod="classmethod" in decorators,
+            is_staticmethod="staticmethod" in decorators,
+            decorators=decorators,
+            parent_class=parent_class,
+            has_docstring=ast.get_docstring(func_node, clean=False) is not None,
+            **_body_start(func_node),
+        )
+
     def _analyze_class(self, class_node: ast.ClassDef) -> ClassInfo:
         """Analyze a class definition."""
         methods = []
@@ -409,8 +570,8 @@ class DocstringAnalyzer:
                 methods.append(method_info)
                 if any(isinstance(d, ast.Name) and d.id == "property" for d in node.decorator_list):
                     properties.append(node.name)
-        bases = [ast.unparse(base) for base in class_node.bases]
-        decorators = [ast.unparse(d) for d in class_node.decorator_list]
+        bases = [_expr_source(base) for base in class_node.bases]
+        decorators = [_expr_source(d) for d in class_node.decorator_list]
         return ClassInfo(
             name=class_node.name,
             lineno=class_node.lineno,
@@ -419,6 +580,8 @@ class DocstringAnalyzer:
             decorators=decorators,
             methods=methods,
             properties=properties,
+            has_docstring=ast.get_docstring(class_node, clean=False) is not None,
+            **_body_start(class_node),
         )
 
 
@@ -430,7 +593,8 @@ class DocstringFixer:
         self.dry_run = dry_run
         self.interactive = interactive
         self.analyzer = DocstringAnalyzer()
-        self.generator = DocstringGenerator()
+        # The generator holds no per-file state, so share the analyzer's instance
+        self.generator = self.analyzer.generator
         self.stats = {
             "files_processed": 0,
             "docstrings_added": 0,
@@ -448,73 +612,103 @@ class DocstringFixer:
                 original_content = f.read()
 
             tree = ast.parse(original_content, filename=str(filepath))
-            module_info = self.analyzer.analyze_file(filepath)
-
-            # Track line adjustments as we add docstrings
-            line_offset = 0
-            lines = original_content.splitlines()
-            changes_made = False
-
-            # Add module docstring if missing
-            if not module_info.has_module_docstring and (module_info.classes or module_info.functions):
-                if self._should_add_docstring("module", filepath.stem):
-                    module_docstring = self.generator.generate_module_docstring(module_info)
-                    lines.insert(0, module_docstring)
-                    lines.insert(1, "")  # Add blank line after module docstring
-                    line_offset += 2
-                    changes_made = True
-                    self.stats["modules_fixed"] += 1
-                    self.stats["docstrings_added"] += 1
-
-            # Process classes and functions in reverse order (bottom to top)
-            # to maintain correct line numbers
+            module_info = self.analyzer.analyze_source(original_content, filepath, tree)
             all_items = []
 
             for class_info in module_info.classes:
-                if not self._has_docstring_at_line(lines, class_info.lineno + line_offset):
+                if not class_info.has_docstring:
                     all_items.append(("class", class_info))
 
                 for method in class_info.methods:
-                    if not self._has_docstring_at_line(lines, method.lineno + line_offset):
+                    if not method.has_docstring:
                         all_items.append(("method", method))
 
             for func_info in module_info.functions:
-                if not self._has_docstring_at_line(lines, func_info.lineno + line_offset):
+                if not func_info.has_docstring:
                     all_items.append(("function", func_info))
 
-            # Sort by line number in reverse order
-            all_items.sort(key=lambda x: x[1].lineno, reverse=True)
+            needs_module_docstring = not module_info.has_module_docstring and (
+                module_info.classes or module_info.functions
+            )
+            if not all_items and not needs_module_docstring:
+                # Nothing to document; skip splitting the file into lines
+                print("  No missing docstrings found")
+                self.stats["files_processed"] += 1
+                return False
+
+            original_lines = original_content.splitlines()
+            added = {"modules_fixed": 0, "classes_fixed": 0, "functions_fixed": 0}
+            module_docstring = None
+
+            # Add module docstring if missing
+            if needs_module_docstring:
+                if self._should_add_docstring("module", filepath.stem):
+                    module_docstring = self.generator.generate_module_docstring(module_info)
+                    added["modules_fixed"] += 1
+
+            # Docstrings keyed by the line of the first body statement they precede
+            insertions: dict[int, str] = {}
+            all_items.sort(key=lambda x: x[1].lineno)
 
             for item_type, item_info in all_items:
+                body_line = original_lines[item_info.body_lineno - 1]
+                if body_line[: item_info.body_col_offset].strip():
+                    # Body shares a line with the signature (def f(x): return x)
+                    continue
                 if self._should_add_docstring(item_type, item_info.name):
                     docstring = self._generate_docstring(item_type, item_info, module_info)
-                    insert_line = item_info.lineno + line_offset
-
-                    # Find the correct position to insert docstring
-                    # (after the function/class definition line)
-                    while insert_line < len(lines) and lines[insert_line - 1].strip().endswith(":"):
-                        break
-
-                    # Insert docstring
-                    lines.insert(insert_line, docstring)
-                    lines.insert(insert_line + 1, "")  # Add blank line
-                    line_offset += 2
-                    changes_made = True
+                    # Templates are indented by four spaces; match the body instead
+                    indent = item_info.body_col_offset - 4
+                    if indent > 0:
+                        docstring = textwrap.indent(docstring, " " * indent)
+                    elif indent < 0:
+                        docstring = textwrap.dedent(docstring)
+                        docstring = textwrap.indent(docstring, " " * item_info.body_col_offset)
+                    insertions[item_info.body_lineno] = docstring
 
                     if item_type == "class":
-                        self.stats["classes_fixed"] += 1
+                        added["classes_fixed"] += 1
                     else:
-                        self.stats["functions_fixed"] += 1
-                    self.stats["docstrings_added"] += 1
+                        added["functions_fixed"] += 1
 
+            changes_made = bool(module_docstring is not None or insertions)
             if changes_made:
+                # Rebuild the file in one pass, emitting each docstring and a
+                # blank line right before the first statement of its body
+                lines = []
+                preamble = _module_preamble_length(original_lines) if module_docstring is not None else 0
+                lines.extend(original_lines[:preamble])
+                if module_docstring is not None:
+                    lines.append(module_docstring)
+                    lines.append("")  # Add blank line after module docstring
+                for lineno, line in enumerate(original_lines[preamble:], start=preamble + 1):
+                    docstring = insertions.get(lineno)
+                    if docstring is not None:
+                        lines.append(docstring)
+                        lines.append("")
+                    lines.append(line)
+
                 new_content = "\n".join(lines)
+                if original_content.endswith("\n"):
+                    new_content += "\n"
+                changes_made = new_content != original_content
 
+            if changes_made:
+                try:
+                    ast.parse(new_content, filename=str(filepath))
+                except SyntaxError as e:
+                    print(f"  Skipping {filepath}: generated code does not parse ({e})")
+                    self.stats["files_processed"] += 1
+                    return False
+                for key, count in added.items():
+                    self.stats[key] += count
+                    self.stats["docstrings_added"] += count
+
+            if changes_made:
                 if self.dry_run:
                     print(f"  [DRY RUN] Would add {self.stats['docstrings_added']} docstrings")
                 else:
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        f.write(new_content)
+                    self._write_atomic(filepath, new_content)
                     print("  ✓ Added docstrings")
             else:
                 print("  No missing docstrings found")
@@ -527,21 +721,17 @@ class DocstringFixer:
             return False
 
     @staticmethod
-    def _has_docstring_at_line(lines: list[str], lineno: int) -> bool:
-        """Check if there's already a docstring at the given line."""
-        if lineno >= len(lines):
-            return False
-
-        # Look for docstring in the next few lines after the definition
-        for i in range(lineno, min(lineno + 5, len(lines))):
-            line = lines[i].strip()
-            if line.startswith('"""') or line.startswith("'''"):
-                return True
-            if line and not line.startswith("#"):
-                # Found non-comment, non-docstring code
-                break
-
-        return False
+    def _write_atomic(filepath: Path, content: str) -> None:
+        """Write content next to filepath and swap it in with os.replace."""
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            shutil.copymode(filepath, tmp_path)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def _should_add_docstring(self, item_type: str, name: str) -> bool:
         """Check if we should add a docstring for this item."""
@@ -569,6 +759,11 @@ class DocstringFixer:
             return self.generator.generate_module_docstring(module_info)
         return '    """TODO: Add description.""'
 
+    def merge_stats(self, stats: dict[str, int]) -> None:
+        """Add stats gathered by another fixer, e.g. a worker process."""
+        for key, value in stats.items():
+            self.stats[key] += value
+
     def print_stats(self):
         """Print statistics about the fixing process."""
         print("\n" + "=" * 50)
@@ -586,6 +781,65 @@ class DocstringFixer:
             print("\n✓ All changes have been applied!")
 
 
+# Common non-source directories skipped by --fix-all
+_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".pytest_cache",
+        "node_modules",
+        ".venv",
+        "venv",
+        "build",
+        "dist",
+    }
+)
+
+
+def _iter_python_files(root: str, excluded: frozenset[str]) -> Iterator[str]:
+    """Yield paths of .py files under root, never descending into excluded dirs."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+# Files handed to each worker per task when fixing in parallel; runs with no
+# more files than this stay in-process, where a pool would only add startup cost
+_WORKER_CHUNKSIZE = 8
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _fix_file_worker(filepath: Path, dry_run: bool) -> tuple[str, dict[str, int]]:
+    """Fix one file in a worker process and return its output and stats.
+
+    Output is captured so the parent prints each file's lines together
+    instead of interleaving them with other workers'.
+    """
+    fixer = DocstringFixer(dry_run=dry_run)
+    with redirect_stdout(io.StringIO()) as output:
+        fixer.fix_file(filepath)
+    return output.getvalue(), fixer.stats
+
+
 def main():
     """Main entry point for the docstring fixer."""
     parser = argparse.ArgumentParser(
@@ -604,6 +858,7 @@ Examples:
     parser.add_argument("--fix-all", action="store_true", help="Process all Python files in the project")
     parser.add_argument("--interactive", action="store_true", help="Ask for confirmation before each change")
     parser.add_argument("--templates", type=str, help="Use custom template directory")
+    parser.add_argument("--jobs", type=_positive_int, help="Number of worker processes (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -617,28 +872,7 @@ Examples:
 
     if args.fix_all:
         # Find all Python files in the project
-        for root, dirs, files in os.walk("."):
-            # Skip common non-source directories
-            dirs[:] = [
-                d
-                for d in dirs
-                if d
-                not in {
-                    ".git",
-                    "__pycache__",
-                    ".pytest_cache",
-                    "node_modules",
-                    ".venv",
-                    "venv",
-                    "build",
-                    "dist",
-                }
-            ]
-
-            for file in files:
-                if file.endswith(".py"):
-                    filepath = Path(root) / file
-                    files_to_process.append(filepath)
+        files_to_process = [Path(path) for path in _iter_python_files(".", _EXCLUDED_DIRS)]
 
     elif args.files:
         # Use glob pattern
@@ -657,8 +891,26 @@ Examples:
     # Create fixer and process files
     fixer = DocstringFixer(dry_run=args.dry_run, interactive=args.interactive)
 
-    for filepath in files_to_process:
-        fixer.fix_file(filepath)
+    # Never start more workers than there are chunks of files to hand out
+    chunks = -(-len(files_to_process) // _WORKER_CHUNKSIZE)
+    jobs = min(max(1, args.jobs or os.cpu_count() or 1), chunks)
+
+    if args.interactive or jobs == 1:
+        # Prompts need the terminal, so interactive runs stay in this process
+        for filepath in files_to_process:
+            fixer.fix_file(filepath)
+    else:
+        # Files are independent; each worker parses and writes its own files
+        # and hands back its output and stats for the summary
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for output, stats in executor.map(
+                _fix_file_worker,
+                files_to_process,
+                [args.dry_run] * len(files_to_process),
+                chunksize=_WORKER_CHUNKSIZE,
+            ):
+                print(output, end="")
+                fixer.merge_stats(stats)
 
     fixer.print_stats()
     return 0
@@ -0,0 +1,52 @@
+"""
+Test core_router.config module
+
+Covers loading services files and the opt-in parsed-document cache.
+"""
+
+from core_router.config import load_services_from_file
+
+SERVICES_YAML = """\
+services:
+  - name: local-echo
+    version: "1.0"
+    adapter: local_python
+    tags: [Echo]
+"""
+
+
+def _write_services(tmp_path):
+    path = tmp_path / "services.yaml"
+    path.write_text(SERVICES_YAML, encoding="utf-8")
+    return path
+
+
+def test_load_does_not_write_without_cache_dir(tmp_path, monkeypatch):
+    """Loading is read-only unless a cache directory is configured."""
+    monkeypatch.delenv("DINOAIR_CONFIG_CACHE_DIR", raising=False)
+    path = _write_services(tmp_path)
+
+    services = load_services_from_file(str(path))
+
+    assert [s.name for s in services] == ["local-echo"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["services.yaml"]
+
+
+def test_load_reuses_cached_document(tmp_path, monkeypatch):
+    """With a cache directory, an unchanged file is served from its JSON copy."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("DINOAIR_CONFIG_CACHE_DIR", str(cache_dir))
+    path = _write_services(tmp_path)
+
+    first = load_services_from_file(str(path))
+    cached = list(cache_dir.iterdir())
+    assert len(cached) == 1
+    assert cached[0].suffix == ".json"
+
+    second = load_services_from_file(str(path))
+    assert [s.model_dump() for s in second] == [s.model_dump() for s in first]
+
+    # Editing the source replaces the stale cache entry
+    path.write_text(SERVICES_YAML.replace("local-echo", "local-echo-2"), encoding="utf-8")
+    assert [s.name for s in load_services_from_file(str(path))] == ["local-echo-2"]
+    assert len(list(cache_dir.iterdir())) == 1
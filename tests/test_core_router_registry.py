@@ -0,0 +1,107 @@
+"""
+Test core_router.registry module
+
+Covers ServiceRegistry registration and lookups, and the soft-failing
+auto-registration helper.
+"""
+
+import threading
+from collections import Counter
+
+import pytest
+from pydantic import ValidationError
+
+from core_router import registry as registry_module
+from core_router.health import HealthState
+from core_router.registry import ServiceDescriptor, ServiceRegistry
+
+
+def _descriptor(name, **overrides):
+    data = {"name": name, "version": "1.0", "adapter": "local_python", "tags": ["Chat"]}
+    data.update(overrides)
+    return ServiceDescriptor(**data)
+
+
+def test_auto_register_survives_unencodable_base_url(monkeypatch):
+    """A base_url httpx cannot IDNA-encode marks the service degraded instead of raising."""
+    service = _descriptor("bad-host", adapter="lmstudio", adapter_config={"base_url": "http://xn--/v1"})
+    monkeypatch.setattr(registry_module, "_load_services_from_file", lambda _path: [service])
+    monkeypatch.setattr(registry_module, "_PROBE_CACHE", {})
+
+    reg = registry_module.auto_register_from_config_and_env(ServiceRegistry())
+
+    assert reg.get_by_name("bad-host").health["state"] == HealthState.degraded.value
+
+
+def test_update_health_copies_caller_dict():
+    """The stored health snapshot is not the caller's dict."""
+    reg = ServiceRegistry()
+    reg.register(_descriptor("svc"))
+    info = {"state": "HEALTHY", "latency_ms": 1.5}
+
+    reg.update_health("svc", info)
+    info["state"] = "DOWN"
+
+    assert reg.get_by_name("svc").health == {"state": "HEALTHY", "latency_ms": 1.5}
+
+
+def test_register_many_indexes_tags_case_insensitively():
+    """register_many stores every descriptor and indexes its tags once."""
+    reg = ServiceRegistry()
+    stored = reg.register_many([_descriptor("a"), {"name": "b", "version": "1.0", "adapter": "x", "tags": ["CHAT"]}])
+
+    assert [sd.name for sd in stored] == ["a", "b"]
+    assert {sd.name for sd in reg.get_by_tag("chat")} == {"a", "b"}
+    assert reg.get_by_name("b") is stored[1]
+
+
+def test_register_many_is_all_or_nothing():
+    """An invalid entry leaves the registry untouched."""
+    reg = ServiceRegistry()
+    reg.register(_descriptor("existing"))
+
+    with pytest.raises(ValidationError):
+        reg.register_many([_descriptor("new"), {"name": "broken"}])
+
+    assert [sd.name for sd in reg.list()] == ["existing"]
+
+
+def test_snapshot_is_shared_until_the_next_write():
+    """Readers get the published tuple without copying; writes publish a new one."""
+    reg = ServiceRegistry()
+    reg.register(_descriptor("a"))
+    before = reg.snapshot()
+
+    assert reg.snapshot() is before
+    reg.register(_descriptor("b"))
+    assert [sd.name for sd in before] == ["a"]
+    assert [sd.name for sd in reg.snapshot()] == ["a", "b"]
+    assert reg.unregister("a") is True
+    assert [sd.name for sd in reg.snapshot()] == ["b"]
+
+
+def test_lock_free_reads_see_whole_batches():
+    """Concurrent readers never observe part of a register_many batch."""
+    reg = ServiceRegistry()
+    stop = threading.Event()
+    torn: list[int] = []
+
+    def write():
+        for round_ in range(200):
+            reg.register_many([_descriptor(f"svc-{round_}-{i}", tags=[f"round-{round_}"]) for i in range(5)])
+        stop.set()
+
+    def read():
+        while not stop.is_set():
+            counts = Counter(sd.tags[0] for sd in reg.snapshot())
+            torn.extend(n for n in counts.values() if n != 5)
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for t in readers:
+        t.start()
+    write()
+    for t in readers:
+        t.join()
+
+    assert torn == []
+    assert len(reg.get_by_tag("ROUND-199")) == 5
@@ -0,0 +1,149 @@
+"""
+Test input_processing.stages.validation module
+
+Covers threat detection and cleaning performed by InputValidator.
+"""
+
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _load_validation_module():
+    """Load validation.py directly; the input_processing package __init__
+    pulls in escaper modules that are not part of this tree."""
+    path = Path(__file__).resolve().parents[1] / "input_processing" / "stages" / "validation.py"
+    spec = importlib.util.spec_from_file_location("_input_validation_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+validation = _load_validation_module()
+InputValidator = validation.InputValidator
+ThreatLevel = validation.ThreatLevel
+
+
+@pytest.fixture
+def validator():
+    """Provide a default validator."""
+    return InputValidator()
+
+
+def test_clean_input_passes(validator):
+    """Plain prose produces no issues and is returned unchanged."""
+    result = validator.validate("Could you summarise the report for me?")
+    assert result.is_valid
+    assert result.threat_level == ThreatLevel.none
+    assert result.issues == []
+    assert result.cleaned_text == "Could you summarise the report for me?"
+
+
+def test_path_traversal_rejected(validator):
+    """Path traversal is high threat and cleaned to nothing."""
+    result = validator.validate("../../etc/passwd")
+    assert not result.is_valid
+    assert result.threat_level == ThreatLevel.high
+    assert "path_traversal: Path traversal attempt: ../" in result.issues
+    assert result.cleaned_text == ""
+
+
+def test_dot_slash_runs_scan_quickly(validator):
+    """Long dot/slash runs must not trigger regex backtracking blow-ups."""
+    payloads = ["." * 30 + "/", ("..." + "/" * 3) * 500, "." * 4000 + "\\"]
+    start = time.perf_counter()
+    for payload in payloads:
+        result = validator.validate(payload)
+        assert result.threat_level == ThreatLevel.high
+    assert time.perf_counter() - start < 0.5
+
+
+def test_control_characters_detected_and_stripped(validator):
+    """Control characters are medium threat; \\n and \\t survive cleaning."""
+    result = validator.validate("line one\x07\nline\ttwo\x1b")
+    assert not result.is_valid
+    assert result.threat_level == ThreatLevel.medium
+    assert "control_characters: Control character detected" in result.issues
+    assert result.cleaned_text == "line one\nline\ttwo"
+
+
+def test_windows_reserved_names(validator):
+    """Reserved stems are flagged whole; longer names are not."""
+    result = validator.validate("open con.txt.bak or LPT1 but not console or nul-x")
+    assert result.issues == [
+        "Windows reserved filename detected: con.txt.bak",
+        "Windows reserved filename detected: LPT1",
+    ]
+    assert result.threat_level == ThreatLevel.medium
+
+
+def test_stop_on_high_keeps_verdict(validator):
+    """Early exit truncates issues but not the verdict or cleaned text."""
+    text = "../secret; rm -rf / $HOME"
+    full = validator.validate(text)
+    quick = validator.validate(text, stop_on_high=True)
+    assert quick.issues == full.issues[: len(quick.issues)]
+    assert len(quick.issues) < len(full.issues)
+    assert (quick.is_valid, quick.threat_level, quick.cleaned_text) == (
+        full.is_valid,
+        full.threat_level,
+        full.cleaned_text,
+    )
+    assert validator.is_threat(text)
+    assert not validator.is_threat("plain words")
+
+
+def test_register_pattern_is_scoped_to_subclass():
+    """Patterns registered on a subclass do not affect InputValidator."""
+    import re
+
+    class StrictValidator(InputValidator):
+        pass
+
+    StrictValidator.register_pattern("custom", re.compile(r"drop\s+table", re.IGNORECASE), ThreatLevel.high, "SQL")
+    assert "custom: SQL" in StrictValidator().validate("please DROP TABLE users").issues
+    assert InputValidator().validate("please DROP TABLE users").issues == []
+
+
+def test_compiled_validator_matches_validate(validator):
+    """The compiled closure returns the same results as validate()."""
+    fast_validate = validator.compile()
+    for text in ["hello", "../etc/passwd", "a; b", "con.txt", "x" * 6000]:
+        assert fast_validate(text) == validator.validate(text)
+
+
+def test_any_path_traversal_hit_rejects_high_threat_text(validator):
+    """High-threat input with a path traversal match is cleaned to nothing."""
+    result = validator.validate("copy a//b; done")
+    assert result.threat_level == ThreatLevel.high
+    assert "path_traversal: Multiple slashes detected" in result.issues
+    assert result.cleaned_text == ""
+
+
+def test_is_safe_path(tmp_path):
+    """Only paths that resolve inside the base directory are safe."""
+    assert InputValidator.is_safe_path(str(tmp_path), "notes/today.txt")
+    assert not InputValidator.is_safe_path(str(tmp_path), "../outside.txt")
+    assert not InputValidator.is_safe_path(str(tmp_path), "bad\x00name")
+
+
+def test_reserved_names_follow_windows_reserved():
+    """Subclasses can extend the reserved filename set."""
+
+    class ClockValidator(InputValidator):
+        windows_reserved = InputValidator.windows_reserved | {"CLOCK"}
+
+    assert ClockValidator().validate("open clock.sys").issues == ["Windows reserved filename detected: clock.sys"]
+    assert InputValidator().validate("open clock.sys").issues == []
+
+
+def test_high_threat_cmd_exe_is_rejected(validator):
+    """High-threat text naming cmd.exe is cleaned to nothing."""
+    result = validator.validate("run cmd.exe; exit")
+    assert result.threat_level == ThreatLevel.high
+    assert result.cleaned_text == ""
+    assert validator.validate("run calc; exit").cleaned_text == "run calc exit"
@@ -0,0 +1,108 @@
+"""
+Test rag.secure_text_extractor module
+
+Covers ExtractionResult and the content-hash keyed extraction result cache.
+"""
+
+import pytest
+
+from rag.secure_text_extractor import ExtractionResult, SecureTextExtractor
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run inside tmp_path; the extractor rejects files outside the working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def counted_reads(monkeypatch):
+    """Count calls to the plain-text reader."""
+    calls = []
+    original = SecureTextExtractor._extract_plain_text
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(SecureTextExtractor, "_extract_plain_text", staticmethod(counting))
+    return calls
+
+
+def test_extraction_result_to_dict():
+    """to_dict exposes the API fields and adds text_iter only for streamed results."""
+    result = ExtractionResult(success=True, text="hi", file_type="text", warnings=["w"])
+
+    data = result.to_dict()
+    assert data == {
+        "success": True,
+        "text": "hi",
+        "file_type": "text",
+        "processing_time": 0.0,
+        "warnings": ["w"],
+        "error": None,
+        "pages_processed": 0,
+        "total_pages": 0,
+    }
+
+    streamed = ExtractionResult(success=True, text_iter=iter(["a"]))
+    assert "text_iter" in streamed.to_dict()
+
+
+def test_unchanged_content_is_served_from_cache(workdir, counted_reads):
+    """Re-extracting identical content, even from another path, reuses the first result."""
+    (workdir / "a.txt").write_text("same text", encoding="utf-8")
+    (workdir / "b.txt").write_text("same text", encoding="utf-8")
+    extractor = SecureTextExtractor(enable_pdf_extraction=False)
+
+    first = extractor.extract_text("a.txt")
+    first.warnings.append("caller mutation")
+    again = extractor.extract_text("a.txt")
+    copy = extractor.extract_text("b.txt")
+
+    assert first.success and first.text == "same text"
+    assert again.text == copy.text == "same text"
+    assert again.warnings == []
+    assert len(counted_reads) == 1
+
+
+def test_changed_content_is_extracted_again(workdir, counted_reads):
+    """Editing a file misses the cache."""
+    path = workdir / "a.txt"
+    path.write_text("v1", encoding="utf-8")
+    extractor = SecureTextExtractor(enable_pdf_extraction=False)
+    extractor.extract_text("a.txt")
+
+    path.write_text("version 2", encoding="utf-8")
+    assert extractor.extract_text("a.txt").text == "version 2"
+    assert len(counted_reads) == 2
+
+
+def test_cache_disabled_and_cleared(workdir, counted_reads):
+    """result_cache_size=0 disables caching and clear_cache empties it."""
+    (workdir / "a.txt").write_text("text", encoding="utf-8")
+
+    uncached = SecureTextExtractor(enable_pdf_extraction=False, result_cache_size=0)
+    uncached.extract_text("a.txt")
+    uncached.extract_text("a.txt")
+    assert len(counted_reads) == 2
+
+    cached = SecureTextExtractor(enable_pdf_extraction=False)
+    cached.extract_text("a.txt")
+    cached.clear_cache()
+    cached.extract_text("a.txt")
+    assert len(counted_reads) == 4
+
+
+def test_streamed_results_are_not_cached(workdir, counted_reads):
+    """A text_iter can only be consumed once, so streamed files are always re-read."""
+    (workdir / "big.txt").write_text("x" * 64, encoding="utf-8")
+    extractor = SecureTextExtractor(enable_pdf_extraction=False, stream_threshold=16)
+
+    first = extractor.extract_text("big.txt")
+    second = extractor.extract_text("big.txt")
+
+    assert first.text == "" and "".join(first.text_iter) == "x" * 64
+    assert "".join(second.text_iter) == "x" * 64
+    assert len(counted_reads) == 2
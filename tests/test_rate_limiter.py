@@ -0,0 +1,82 @@
+"""
+Test input_processing.stages.rate_limiter module
+
+Covers the RateLimiter.try_acquire fast path and its fallback contract.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_rate_limiter_module():
+    """Load rate_limiter.py directly; the input_processing package __init__
+    pulls in escaper modules that are not part of this tree."""
+    path = Path(__file__).resolve().parents[1] / "input_processing" / "stages" / "rate_limiter.py"
+    spec = importlib.util.spec_from_file_location("_rate_limiter_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+rate_limiter = _load_rate_limiter_module()
+RateLimitConfig = rate_limiter.RateLimitConfig
+RateLimiter = rate_limiter.RateLimiter
+RateLimitStrategy = rate_limiter.RateLimitStrategy
+
+
+def _limiter(limit=3, **overrides):
+    config = RateLimitConfig(max_requests=limit, action_limits={"default": limit}, **overrides)
+    return RateLimiter(config)
+
+
+def test_try_acquire_allows_up_to_the_limit():
+    """Requests within the window limit are recorded; the next one is refused."""
+    limiter = _limiter(limit=3)
+
+    assert [limiter.try_acquire("user") for _ in range(4)] == [True, True, True, False]
+    assert limiter.stats["total_requests"] == 3
+    assert limiter.stats["unique_users"] == {"user"}
+
+
+def test_try_acquire_refusal_records_nothing():
+    """A refused fast-path request leaves the full check to report the violation."""
+    limiter = _limiter(limit=1)
+    limiter.try_acquire("user")
+
+    assert limiter.try_acquire("user") is False
+    assert limiter.stats["blocked_requests"] == 0
+    assert not limiter.violations["user"]
+
+    status = limiter.check_rate_limit("user")
+    assert status.allowed is False
+    assert status.violations == 1
+
+
+def test_try_acquire_counts_share_the_window_with_check_rate_limit():
+    """Fast-path and full-path requests consume the same sliding window."""
+    limiter = _limiter(limit=2)
+
+    assert limiter.try_acquire("user") is True
+    assert limiter.check_rate_limit("user").allowed is True
+    assert limiter.try_acquire("user") is False
+
+
+def test_try_acquire_uses_action_limits_and_separate_keys():
+    """Per-action limits apply and each key has its own window."""
+    limiter = RateLimiter(RateLimitConfig(action_limits={"default": 5, "code": 1}))
+
+    assert limiter.try_acquire("a", "code") is True
+    assert limiter.try_acquire("a", "code") is False
+    assert limiter.try_acquire("b", "code") is True
+
+
+def test_try_acquire_defers_other_strategies_and_penalties():
+    """Only the sliding window has a fast path; penalised keys take the full path."""
+    bucket = RateLimiter(RateLimitConfig(strategy=RateLimitStrategy.token_bucket))
+    assert bucket.try_acquire("user") is False
+
+    limiter = _limiter(limit=5)
+    limiter.penalties["user"] = rate_limiter.datetime.now()
+    assert limiter.try_acquire("user") is False
@@ -0,0 +1,117 @@
+"""
+Tests for scripts/add_missing_docstrings.py
+
+This test suite covers:
+- Docstring placement after multi-line signatures and decorators
+- Skipping definitions whose body shares the signature line
+- Module docstrings after a shebang/encoding preamble
+- Command-line validation of --jobs
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import add_missing_docstrings
+from add_missing_docstrings import DocstringFixer
+
+SOURCE = '''#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import functools
+
+
+@functools.lru_cache
+def compute(
+    alpha: int,
+    beta: int = 2,
+) -> int:
+    return alpha + beta
+
+
+def one_liner(x): return x
+
+
+class Widget:
+    def method(
+        self,
+        value,
+    ):
+        return value
+'''
+
+
+def _fix(tmp_path, source=SOURCE):
+    path = tmp_path / "sample.py"
+    path.write_text(source, encoding="utf-8")
+    assert DocstringFixer().fix_file(path) is True
+    return path.read_text(encoding="utf-8")
+
+
+def _functions(tree):
+    return {node.name: node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.ClassDef))}
+
+
+class TestDocstringInsertion:
+    """Test where the fixer inserts generated docstrings."""
+
+    @staticmethod
+    def test_multiline_signatures_get_a_docstring_in_the_body(tmp_path):
+        """Docstrings follow the closing line of a multi-line signature and parse cleanly."""
+        tree = ast.parse(_fix(tmp_path))
+        nodes = _functions(tree)
+
+        assert ast.get_docstring(nodes["compute"])
+        assert ast.get_docstring(nodes["method"])
+        assert ast.get_docstring(nodes["Widget"])
+        # The original bodies are untouched after the new docstring
+        assert isinstance(nodes["compute"].body[1], ast.Return)
+        assert isinstance(nodes["method"].body[1], ast.Return)
+
+    @staticmethod
+    def test_inline_bodies_are_left_alone(tmp_path):
+        """A body on the def line cannot take a docstring and is skipped."""
+        content = _fix(tmp_path)
+
+        assert "def one_liner(x): return x\n" in content
+        assert ast.get_docstring(_functions(ast.parse(content))["one_liner"]) is None
+
+    @staticmethod
+    def test_module_docstring_follows_the_preamble(tmp_path):
+        """Shebang and encoding lines stay first; the module docstring comes next."""
+        content = _fix(tmp_path)
+        lines = content.splitlines()
+
+        assert lines[0] == "#!/usr/bin/env python"
+        assert lines[1] == "# -*- coding: utf-8 -*-"
+        assert lines[2].startswith('"""')
+        assert ast.get_docstring(ast.parse(content))
+
+    @staticmethod
+    def test_dry_run_does_not_write(tmp_path):
+        """Dry runs leave the file as it was."""
+        path = tmp_path / "sample.py"
+        path.write_text(SOURCE, encoding="utf-8")
+
+        DocstringFixer(dry_run=True).fix_file(path)
+
+        assert path.read_text(encoding="utf-8") == SOURCE
+
+
+class TestCommandLine:
+    """Test command-line argument handling."""
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", ["0", "-1", "many"])
+    def test_invalid_jobs_are_rejected(jobs, monkeypatch):
+        """--jobs must be a positive integer."""
+        monkeypatch.setattr(sys, "argv", ["add_missing_docstrings.py", "--files", "*.py", "--jobs", jobs])
+
+        with pytest.raises(SystemExit) as excinfo:
+            add_missing_docstrings.main()
+
+        assert excinfo.value.code == 2
@@ -0,0 +1,69 @@
+"""
+Test utils.shutdown_protocols module
+
+Covers ShutdownMixin's cleanup and callback ordering.
+"""
+
+from utils.shutdown_protocols import ShutdownMixin
+
+
+class _Service(ShutdownMixin):
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def _cleanup_resources(self):
+        self.events.append("cleanup")
+
+
+def test_callbacks_run_lifo_after_cleanup_and_once():
+    """Cleanup runs first, then callbacks newest-first; shutdown is idempotent."""
+    events = []
+    service = _Service(events)
+    service.register_shutdown_callback(lambda: events.append("first"))
+    service.register_shutdown_callback(lambda: events.append("second"))
+
+    service.shutdown()
+    service.shutdown()
+
+    assert events == ["cleanup", "second", "first"]
+    assert service.is_shutdown
+
+
+def test_callbacks_registered_during_shutdown_still_run():
+    """A callback that registers another callback does not lose it."""
+    events = []
+    service = _Service(events)
+
+    def registers_more():
+        events.append("outer")
+        service.register_shutdown_callback(lambda: events.append("inner"))
+
+    service.register_shutdown_callback(registers_more)
+    service.shutdown()
+
+    assert events == ["cleanup", "outer", "inner"]
+
+
+def test_callback_after_shutdown_runs_immediately():
+    """Registering on a shut-down service invokes the callback right away."""
+    events = []
+    service = _Service(events)
+    service.shutdown()
+
+    service.register_shutdown_callback(lambda: events.append("late"))
+
+    assert events == ["cleanup", "late"]
+
+
+def test_failing_callback_does_not_stop_the_others():
+    """Errors in one callback are logged and the rest still run."""
+    events = []
+    service = _Service(events)
+    service.register_shutdown_callback(lambda: events.append("survivor"))
+    service.register_shutdown_callback(lambda: 1 / 0)
+
+    with service:
+        pass
+
+    assert events == ["cleanup", "survivor"]
@@ -405,5 +405,30 @@ class TestDependencyContainer:
         assert resolved is test_service
 
 
+
+class TestSafeImports:
+    """Test allowlisted dynamic imports."""
+
+    @staticmethod
+    def test_safe_import_from_map_sees_patched_attribute():
+        """A patched attribute is returned on the next lookup, not a stale cached value."""
+        from utils.safe_imports import safe_import_from_map
+
+        specs = {"dumps": ("json", "dumps")}
+        original = safe_import_from_map(specs, "dumps")
+
+        replacement = Mock()
+        with patch("json.dumps", replacement):
+            assert safe_import_from_map(specs, "dumps") is replacement
+        assert safe_import_from_map(specs, "dumps") is original
+
+    @staticmethod
+    def test_safe_import_rejects_unlisted_key():
+        """Keys outside the allowlist are refused."""
+        from utils.safe_imports import SafeImportError, safe_import
+
+        with pytest.raises(SafeImportError):
+            safe_import("os", {"json": "json"})
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping, Set
+from functools import lru_cache
 from importlib import import_module
 from types import ModuleType
 from typing import Any
@@ -37,12 +40,34 @@ def _sanitize_for_log(s: str) -> str:
     return s.replace("\r", "").replace("\n", "") if isinstance(s, str) else s
 
 
+# Allow: letters, numbers, dots, underscores (standard Python module names)
+_SAFE_MODULE_NAME_RE = re.compile(r"^[a-zA-Z0-9_.]+$")
+
+
+@lru_cache(maxsize=256)
+def _module_name_problem(module_name: str) -> str | None:
+    """Classify a mapped module name once per distinct value.
+
+    Allowlists are module-level constants, so the same names are checked on
+    every call; the verdict only depends on the string itself.
+
+    Returns:
+        None if the name is acceptable, "invalid" for relative/path-like or
+        colon-bearing names, or "unsafe" for names with disallowed characters.
+    """
+    if not module_name or module_name.startswith((".", "/")) or ":" in module_name:
+        return "invalid"
+    if not _SAFE_MODULE_NAME_RE.match(module_name):
+        return "unsafe"
+    return None
+
+
 # New specific exception for import hardening
 class SafeImportError(ImportError):
     """Raised when a safe import or attribute load is rejected by policy."""
 
 
-def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
+def safe_import(key: str, allowed: Mapping[str, str]) -> ModuleType:
     """Safely import a module using an explicit allowlist mapping.
 
     Args:
@@ -50,6 +75,7 @@ def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
              exactly against the keys of the 'allowed' mapping. Callers must
              NOT pass dotted import paths directly.
         allowed: Mapping of allowed keys to fully-qualified module names to import.
+             Prefer a module-level constant (dict or ``MappingProxyType``).
 
     Returns:
         The imported module object.
@@ -69,7 +95,8 @@ def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
     module_name = str(allowed[k]).strip()
     # Disallow oddities; only dotted absolute module names are permitted.
     # Additional security: prevent path traversal and ensure alphanumeric + dots + underscores only
-    if not module_name or module_name.startswith((".", "/")) or ":" in module_name:
+    problem = _module_name_problem(module_name)
+    if problem == "invalid":
         logger.debug(
             "safe_import invalid module mapping",
             extra={"key": _sanitize_for_log(k), "module": module_name},
@@ -77,10 +104,7 @@ def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
         raise SafeImportError(f"invalid module mapping for key: {k!r}")
 
     # Enhanced validation: ensure module name contains only safe characters
-    # Allow: letters, numbers, dots, underscores (standard Python module names)
-    import re
-
-    if not re.match(r"^[a-zA-Z0-9_.]+$", module_name):
+    if problem == "unsafe":
         logger.debug(
             "safe_import unsafe characters in module name",
             extra={"key": _sanitize_for_log(k), "module": module_name},
@@ -89,11 +113,10 @@ def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
 
     # Additional check: module must be in the explicit allowlist already
     # This prevents dynamic module loading based on user input
-    # The 'allowed' dict must be statically defined, not from user input
+    # The 'allowed' mapping must be statically defined, not from user input
 
     try:
-        module = import_module(module_name)
-        return module
+        return import_module(module_name)
     except Exception as exc:
         logger.debug(
             "safe_import import failed",
@@ -102,25 +125,25 @@ def safe_import(key: str, allowed: dict[str, str]) -> ModuleType:
         raise SafeImportError(f"import failed for allowed module: {module_name!r}") from exc
 
 
-def safe_load_attr(module: ModuleType, name: str, allowed: set[str]) -> Any:
-    """Safely load an attribute from a module using an explicit allowlist.
+def _validate_attr_name(module_label: str, name: str, allowed: Set[str]) -> str:
+    """Validate an attribute name against an allowlist and return it normalized.
 
     Args:
-        module: Imported module to read from.
-        name: Attribute name to retrieve. Dotted attribute lookups are not supported.
-        allowed: Set of allowed attribute names for this module.
+        module_label: Module name used for logging context.
+        name: Attribute name to check.
+        allowed: Set of allowed attribute names.
 
     Returns:
-        The attribute value.
+        The stripped attribute name.
 
     Raises:
-        AttributeError: If the attribute is not allowed or not present.
+        AttributeError: If the attribute is not allowed or is not a plain name.
     """
     n = str(name or "").strip()
     if not n or n not in allowed:
         logger.debug(
             "safe_load_attr rejected attribute",
-            extra={"module": getattr(module, "__name__", repr(module)), "name": n},
+            extra={"module": module_label, "name": n},
         )
         raise AttributeError(f"attribute not allowed: {n!r}")
 
@@ -128,10 +151,29 @@ def safe_load_attr(module: ModuleType, name: str, allowed: set[str]) -> Any:
     if "." in n or "/" in n or ":" in n:
         logger.debug(
             "safe_load_attr invalid attribute name",
-            extra={"module": getattr(module, "__name__", repr(module)), "name": n},
+            extra={"module": module_label, "name": n},
         )
         raise AttributeError(f"invalid attribute name: {n!r}")
 
+    return n
+
+
+def safe_load_attr(module: ModuleType, name: str, allowed: Set[str]) -> Any:
+    """Safely load an attribute from a module using an explicit allowlist.
+
+    Args:
+        module: Imported module to read from.
+        name: Attribute name to retrieve. Dotted attribute lookups are not supported.
+        allowed: Set (or frozenset) of allowed attribute names for this module.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the attribute is not allowed or not present.
+    """
+    n = _validate_attr_name(getattr(module, "__name__", repr(module)), name, allowed)
+
     try:
         return getattr(module, n)
     except AttributeError:
@@ -142,7 +184,7 @@ def safe_load_attr(module: ModuleType, name: str, allowed: set[str]) -> Any:
         raise
 
 
-def safe_import_from_map(specs: dict[str, tuple[str, str]], key: str) -> Any:
+def safe_import_from_map(specs: Mapping[str, tuple[str, str]], key: str) -> Any:
     """Safely import an object using a key -> (module, attr) specification map.
 
     Args:
@@ -19,7 +19,14 @@ ShutdownCallback = Callable[[], Any]
 
 
 class ShutdownMixin:
-    """Mixin that standardises shutdown behaviour for services."""
+    """Mixin that standardises shutdown behaviour for services.
+
+    The mixin declares ``__slots__`` for its own state. Subclasses that want a
+    ``__dict__``-free layout must declare ``__slots__`` as well; subclasses that
+    do not simply keep a regular instance ``__dict__``.
+    """
+
+    __slots__ = ("_shutdown_lock", "_shutdown_callbacks", "_is_shutdown")
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -82,9 +89,12 @@ class ShutdownMixin:
 
     def _run_callbacks(self) -> None:
         """Invoke registered shutdown callbacks in LIFO order."""
+        # Detach the list before each pass; callbacks registered by a running
+        # callback land in a fresh list and are drained by the next pass.
         while self._shutdown_callbacks:
-            callback = self._shutdown_callbacks.pop()
-            ShutdownMixin._invoke_callback(callback)
+            callbacks, self._shutdown_callbacks = self._shutdown_callbacks, []
+            for callback in reversed(callbacks):
+                ShutdownMixin._invoke_callback(callback)
 
     @staticmethod
     def _invoke_callback(callback: ShutdownCallback) -> None: